@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import Any
 
-from zotomatic import __version__, pipelines
+from zotomatic import __version__
 from zotomatic.errors import ZotomaticCLIError, ZotomaticError
 
 from . import api
@@ -15,22 +16,7 @@ from . import api
 # TODO: verbose対応,dry-run対応
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="zotomatic",
-        description="Zotomatic command-line interface",
-        add_help=False,
-    )
-    parser.add_argument(
-        "--version",
-        "-V",
-        action="version",
-        version=__version__,
-        help="Show version and exit",
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    scan = subparsers.add_parser("scan", help="Scan for PDFs and generate notes")
+def _configure_scan(scan: argparse.ArgumentParser) -> None:
     scan_mode = scan.add_mutually_exclusive_group()
     scan_mode.add_argument(
         "--once",
@@ -61,15 +47,22 @@ def _build_parser() -> argparse.ArgumentParser:
         choices=["quick", "standard", "deep"],
         help="Override summary mode for this scan only (quick, standard, deep)",
     )
-    config_parser = subparsers.add_parser("config", help="Manage configuration values")
+
+
+def _configure_config(config_parser: argparse.ArgumentParser) -> None:
     config_subparsers = config_parser.add_subparsers(dest="config_command")
     config_subparsers.add_parser("show", help="Show effective configuration values")
     config_subparsers.add_parser("default", help="Reset config to defaults")
     config_subparsers.add_parser(
         "migrate", help="Migrate config values to the latest schema"
     )
-    subparsers.add_parser("doctor", help="Inspect project health")
-    init = subparsers.add_parser("init", help="Initialize a Zotomatic workspace")
+
+
+def _configure_doctor(_doctor: argparse.ArgumentParser) -> None:
+    return None
+
+
+def _configure_init(init: argparse.ArgumentParser) -> None:
     init.add_argument(
         "--pdf-dir",
         dest="pdf_dir",
@@ -92,7 +85,9 @@ def _build_parser() -> argparse.ArgumentParser:
         choices=["openai", "gemini", "chatgpt"],
         help="Optional LLM provider (openai, gemini, chatgpt)",
     )
-    llm = subparsers.add_parser("llm", help="Manage LLM settings")
+
+
+def _configure_llm(llm: argparse.ArgumentParser) -> None:
     llm_subparsers = llm.add_subparsers(dest="llm_command", required=True)
     llm_set = llm_subparsers.add_parser("set", help="Set LLM configuration values")
     llm_set.add_argument(
@@ -117,7 +112,9 @@ def _build_parser() -> argparse.ArgumentParser:
         dest="llm_base_url",
         help="LLM base URL",
     )
-    template = subparsers.add_parser("template", help="Manage note templates")
+
+
+def _configure_template(template: argparse.ArgumentParser) -> None:
     template_subparsers = template.add_subparsers(
         dest="template_command", required=True
     )
@@ -134,9 +131,66 @@ def _build_parser() -> argparse.ArgumentParser:
         "--path", dest="template_path", required=True, help="Template file path"
     )
 
+
+# サブコマンド名 -> (help, 引数を組み立てる関数)。引数は該当コマンドのときだけ組み立てる。
+_SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "scan": ("Scan for PDFs and generate notes", _configure_scan),
+    "config": ("Manage configuration values", _configure_config),
+    "doctor": ("Inspect project health", _configure_doctor),
+    "init": ("Initialize a Zotomatic workspace", _configure_init),
+    "llm": ("Manage LLM settings", _configure_llm),
+    "template": ("Manage note templates", _configure_template),
+}
+
+# (コマンド, サブコマンド) -> "module:function"。import は実行直前まで遅らせる。
+_HANDLERS: dict[tuple[str, str | None], str] = {
+    ("scan", None): "zotomatic.pipelines:run_scan",
+    ("doctor", None): "zotomatic.pipelines:run_doctor",
+    ("init", None): "zotomatic.pipelines:run_init",
+    ("template", "create"): "zotomatic.pipelines:run_template_create",
+    ("template", "set"): "zotomatic.pipelines:run_template_set",
+    ("config", "show"): "zotomatic.pipelines:run_config_show",
+    ("config", "default"): "zotomatic.pipelines:run_config_default",
+    ("config", "migrate"): "zotomatic.pipelines:run_config_migrate",
+    ("llm", "set"): "zotomatic.pipelines:run_llm_set",
+}
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """CLIパーサを作る。command 指定時はそのサブコマンドの引数だけを組み立てる。"""
+    parser = argparse.ArgumentParser(
+        prog="zotomatic",
+        description="Zotomatic command-line interface",
+        add_help=False,
+    )
+    parser.add_argument(
+        "--version",
+        "-V",
+        action="version",
+        version=__version__,
+        help="Show version and exit",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, configure) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if command is None or command == name:
+            configure(subparser)
+
     return parser
 
 
+def _resolve_handler(target: str) -> Callable[[dict[str, Any]], Any]:
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def __getattr__(name: str) -> Any:
+    # 既存コードやテストからの cli.pipelines 参照は初回アクセス時に import する
+    if name == "pipelines":
+        return importlib.import_module("zotomatic.pipelines")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _print_help() -> None:
     print("Zotomatic command-line interface")
     print("")
@@ -197,59 +251,26 @@ def _normalize_cli_options(namespace: argparse.Namespace) -> dict[str, Any]:
 
 
 def main(argv: Sequence[str] | None = None) -> None:
-    parser = _build_parser()
     args_list = list(argv) if argv is not None else sys.argv[1:]
     if not args_list or "-h" in args_list or "--help" in args_list:
         _print_help()
         return
+    command = next((arg for arg in args_list if not arg.startswith("-")), None)
+    parser = _build_parser(command if command in _SUBCOMMANDS else None)
     args = parser.parse_args(args_list)
 
-    # Run pipelines.
-    handlers: dict[str, Any] = {
-        "scan": pipelines.run_scan,
-        "doctor": pipelines.run_doctor,
-        "init": pipelines.run_init,
-        "template": None,
-        "config": None,
-        "llm": None,
-    }
-
     command = args.command
+    subcommand = getattr(args, f"{command}_command", None)
+    if command == "config" and not subcommand:
+        subcommand = "show"
     cli_options = _normalize_cli_options(args)
 
     try:
-        if command == "template":
-            template_command = args.template_command
-            if template_command == "create":
-                pipelines.run_template_create(cli_options)
-            elif template_command == "set":
-                pipelines.run_template_set(cli_options)
-            else:  # pragma: no cover - argparse enforces choices
-                raise ZotomaticCLIError(f"Unknown template command: {template_command}")
-            return
-        if command == "config":
-            config_command = args.config_command
-            if not config_command:
-                config_command = "show"
-            if config_command == "show":
-                pipelines.run_config_show(cli_options)
-            elif config_command == "default":
-                pipelines.run_config_default(cli_options)
-            elif config_command == "migrate":
-                pipelines.run_config_migrate(cli_options)
-            else:  # pragma: no cover - argparse enforces choices
-                raise ZotomaticCLIError(f"Unknown config command: {config_command}")
-            return
-        if command == "llm":
-            llm_command = args.llm_command
-            if llm_command == "set":
-                pipelines.run_llm_set(cli_options)
-            else:  # pragma: no cover - argparse enforces choices
-                raise ZotomaticCLIError(f"Unknown llm command: {llm_command}")
-            return
-
-        handler = handlers[command]
-        handler(cli_options)
+        target = _HANDLERS.get((command, subcommand))
+        if target is None:  # pragma: no cover - argparse enforces choices
+            raise ZotomaticCLIError(f"Unknown {command} command: {subcommand}")
+        # Run pipelines.
+        _resolve_handler(target)(cli_options)
     except ZotomaticError as exc:
         print(f"zotomatic: error: {exc}", file=sys.stderr)
         hint = getattr(exc, "hint", None)
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import copy
 import os
 import re
+import stat
+import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Mapping
 
 from zotomatic.errors import ZotomaticConfigError
@@ -14,7 +19,10 @@ from zotomatic.llm.types import LLM_PROVIDER_DEFAULTS
 try:  # Python >=3.11
     import tomllib  # type: ignore[import-not-found]
 except ModuleNotFoundError:  # pragma: no cover - fallback for <3.11
-    tomllib = None  # type: ignore[assignment]
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        tomllib = None  # type: ignore[assignment]
 
 _ENV_PREFIX = "ZOTOMATIC_"
 _TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
@@ -42,7 +50,8 @@ _DEFAULT_TEMPLATE_PATH = _default_template_path()
 
 _SCHEMA_VERSION = 2
 
-_DEFAULT_SETTINGS: dict[str, Any] = {
+# 読み取り専用。書き換える場合はコピーしてから使う
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType({
     "note_dir": _default_notes_dir(),
     "pdf_alias_prefix": "zotero:/storage",
     "llm_output_language": "ja",
@@ -58,7 +67,7 @@ _DEFAULT_SETTINGS: dict[str, Any] = {
     "note_title_pattern": "{{ year }}-{{ slug80 }}-{{ citekey }}",
     "template_path": _DEFAULT_TEMPLATE_PATH,
     "watch_verbose_logging": False,
-}
+})
 _INTERNAL_FIXED_SETTINGS = {
     "pdf_alias_prefix",
     "llm_input_char_limit",
@@ -138,7 +147,7 @@ def get_schema_version(config_path: Path | None = None) -> int:
             hint="Use Python 3.11+ or install tomli for older versions.",
         )
     try:
-        data = tomllib.loads(config_path.read_text(encoding="utf-8"))  # type: ignore[union-attr]
+        data = _read_toml(config_path)
     except (OSError, ValueError) as exc:
         raise ZotomaticConfigError(
             "Failed to parse config file.",
@@ -252,9 +261,19 @@ def update_config_value(config_path: Path, key: str, value: Any) -> bool:
     rendered = f"{key} = {_render_value(value)}"
     if not config_path.exists():
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(rendered + "\n", encoding="utf-8")
+        _write_config_text(config_path, rendered + "\n", encoding="utf-8")
         return True
 
+    if tomllib is not None:
+        # 値が既に同じなら行の走査も書き込みもしない
+        try:
+            current = _read_toml(config_path)
+        except (OSError, ValueError):
+            current = {}
+        existing = current.get(key)
+        if type(existing) is type(value) and existing == value:
+            return False
+
     text = config_path.read_text(encoding="utf-8")
     pattern = re.compile(rf"^\s*{re.escape(key)}\s*=")
     lines = text.splitlines()
@@ -266,7 +285,7 @@ def update_config_value(config_path: Path, key: str, value: Any) -> bool:
             updated = "\n".join(lines)
             if text.endswith("\n"):
                 updated += "\n"
-            config_path.write_text(updated, encoding="utf-8")
+            _write_config_text(config_path, updated, encoding="utf-8")
             return True
 
     section_header = re.compile(r"^\s*\[.+\]\s*$")
@@ -277,7 +296,7 @@ def update_config_value(config_path: Path, key: str, value: Any) -> bool:
             break
     if insert_at is None:
         updated = text.rstrip("\n") + "\n" + rendered + "\n"
-        config_path.write_text(updated, encoding="utf-8")
+        _write_config_text(config_path, updated, encoding="utf-8")
         return True
     if insert_at > 0 and lines[insert_at - 1].strip():
         lines.insert(insert_at, "")
@@ -286,7 +305,7 @@ def update_config_value(config_path: Path, key: str, value: Any) -> bool:
     updated = "\n".join(lines)
     if text.endswith("\n"):
         updated += "\n"
-    config_path.write_text(updated, encoding="utf-8")
+    _write_config_text(config_path, updated, encoding="utf-8")
     return True
 
 
@@ -296,13 +315,37 @@ def update_config_section_value(
     key: str,
     value: Any,
 ) -> bool:
-    rendered = f"{key} = {_render_value(value)}"
-    if not config_path.exists():
+    return bool(apply_updates(config_path, {section: {key: value}}))
+
+
+def apply_updates(
+    config_path: Path,
+    updates: Mapping[str, Mapping[str, Any]],
+) -> list[str]:
+    """Apply ``{section: {key: value}}`` updates with one read and one write.
+
+    Returns the dotted names (``section.key``) of the values that changed.
+    """
+    text = config_path.read_text(encoding="utf-8") if config_path.exists() else ""
+    changed: list[str] = []
+    for section, values in updates.items():
+        for key, value in values.items():
+            text, updated = _set_section_value(text, section, key, value)
+            if updated:
+                changed.append(f"{section}.{key}")
+    if changed:
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(f"[{section}]\n{rendered}\n", encoding="utf-8")
-        return True
+        _write_text_atomic(config_path, text)
+    return changed
 
-    text = config_path.read_text(encoding="utf-8")
+
+def _set_section_value(
+    text: str,
+    section: str,
+    key: str,
+    value: Any,
+) -> tuple[str, bool]:
+    rendered = f"{key} = {_render_value(value)}"
     lines = text.splitlines()
     section_header = f"[{section}]"
     header_pattern = re.compile(r"^\s*\[(.+)\]\s*$")
@@ -320,13 +363,12 @@ def update_config_section_value(
             continue
         if in_section and key_pattern.match(line):
             if line.strip() == rendered:
-                return False
+                return text, False
             lines[idx] = rendered
             updated = "\n".join(lines)
             if text.endswith("\n"):
                 updated += "\n"
-            config_path.write_text(updated, encoding="utf-8")
-            return True
+            return updated, True
 
     if section_found:
         insert_at = len(lines)
@@ -345,8 +387,7 @@ def update_config_section_value(
         updated = "\n".join(lines)
         if text.endswith("\n"):
             updated += "\n"
-        config_path.write_text(updated, encoding="utf-8")
-        return True
+        return updated, True
 
     if lines and lines[-1].strip():
         lines.append("")
@@ -354,19 +395,63 @@ def update_config_section_value(
     lines.append(rendered)
     updated = "\n".join(lines)
     updated += "\n"
-    config_path.write_text(updated, encoding="utf-8")
-    return True
+    return updated, True
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    # シンボリックリンクは実体を置き換え、既存ファイルのパーミッションは引き継ぐ
+    path = path.resolve()
+    try:
+        mode: int | None = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+        _read_toml_cached.cache_clear()
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def _load_file_config(path: Path) -> dict[str, Any]:
     if tomllib is None or not path.is_file():
         return {}
     try:
-        return tomllib.loads(path.read_text(encoding="utf-8"))  # type: ignore[union-attr]
+        return _read_toml(path)
     except (OSError, ValueError):
         return {}
 
 
+def _read_toml(path: Path) -> dict[str, Any]:
+    """TOMLを読む。同じ (path, mtime, size) の再読込はキャッシュから複製を返す。"""
+    file_stat = path.stat()
+    cached = _read_toml_cached(str(path), file_stat.st_mtime_ns, file_stat.st_size)
+    return copy.deepcopy(cached)
+
+
+@lru_cache(maxsize=8)
+def _read_toml_cached(path: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    # バイナリのまま tomllib に渡す（文字列へのデコードを省く）
+    with open(path, "rb") as handle:
+        return tomllib.load(handle)  # type: ignore[union-attr]
+
+
+def _write_config_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """設定ファイルを書き込み、mtime の粒度に頼らずTOMLキャッシュを破棄する。"""
+    path.write_text(text, encoding=encoding)
+    _read_toml_cached.cache_clear()
+
+
 def _load_env_config() -> dict[str, Any]:
     config: dict[str, Any] = {}
     for env_key, raw_value in os.environ.items():
@@ -376,6 +461,15 @@ def _load_env_config() -> dict[str, Any]:
     return config
 
 
+# provider ごとの (環境変数キー, 設定キー) の組
+_LLM_ENV_SCHEMA: dict[str, tuple[tuple[str, str], ...]] = {
+    provider: tuple(
+        (f"llm_{provider}_{field}", field) for field in ("api_key", "model", "base_url")
+    )
+    for provider in LLM_PROVIDER_DEFAULTS
+}
+
+
 def _build_llm_section_from_env(env_config: Mapping[str, Any]) -> dict[str, Any]:
     provider = env_config.get("llm_provider")
     if not provider:
@@ -383,22 +477,14 @@ def _build_llm_section_from_env(env_config: Mapping[str, Any]) -> dict[str, Any]
     provider_name = str(provider).strip().lower()
     if provider_name == "chatgpt":
         provider_name = "openai"
-    if provider_name not in LLM_PROVIDER_DEFAULTS:
+    schema = _LLM_ENV_SCHEMA.get(provider_name)
+    if schema is None:
         return {}
 
-    providers: dict[str, Any] = {}
-    settings: dict[str, Any] = {}
-    api_key_key = f"llm_{provider_name}_api_key"
-    model_key = f"llm_{provider_name}_model"
-    base_url_key = f"llm_{provider_name}_base_url"
-    if api_key := env_config.get(api_key_key):
-        settings["api_key"] = api_key
-    if model := env_config.get(model_key):
-        settings["model"] = model
-    if base_url := env_config.get(base_url_key):
-        settings["base_url"] = base_url
-    providers[provider_name] = settings
-    return {"provider": provider_name, "providers": providers}
+    settings = {
+        field: value for env_key, field in schema if (value := env_config.get(env_key))
+    }
+    return {"provider": provider_name, "providers": {provider_name: settings}}
 
 
 def get_config_with_sources(
@@ -415,11 +501,8 @@ def get_config_with_sources(
         if value is not None and key != "config_path"
     }
 
-    merged: dict[str, Any] = dict(_DEFAULT_SETTINGS)
-    sources: dict[str, str] = {key: "default" for key in merged}
-    for key, value in file_config.items():
-        merged[key] = value
-        sources[key] = "file"
+    merged: dict[str, Any] = dict(file_config)
+    sources: dict[str, str] = dict.fromkeys(merged, "file")
     for key, value in env_config.items():
         merged[key] = value
         sources[key] = "env"
@@ -451,6 +534,8 @@ def get_config_with_sources(
         merged[key] = value
         sources[key] = "cli"
 
+    for key, value in _DEFAULT_SETTINGS.items():
+        merged.setdefault(key, value)
     for key in _INTERNAL_FIXED_SETTINGS:
         merged[key] = _DEFAULT_SETTINGS[key]
         sources[key] = "fixed"
@@ -518,7 +603,8 @@ def initialize_config(cli_options: Mapping[str, Any] | None = None) -> InitResul
     config_created = False
     config_updated_keys: list[str] = []
     if not config_path.exists():
-        config_path.write_text(
+        _write_config_text(
+            config_path,
             _build_default_config_template(init_settings), encoding="utf-8"
         )
         config_created = True
@@ -543,7 +629,8 @@ def initialize_config(cli_options: Mapping[str, Any] | None = None) -> InitResul
             merged_settings["schema_version"] = file_config.get(
                 "schema_version", _SCHEMA_VERSION
             )
-            config_path.write_text(
+            _write_config_text(
+                config_path,
                 _render_canonical_config(
                     merged_settings, include_llm_sections=True
                 ),
@@ -594,7 +681,8 @@ def reset_config_to_defaults() -> ResetResult:
             config_path.read_text(encoding="utf-8"), encoding="utf-8"
         )
 
-    config_path.write_text(
+    _write_config_text(
+        config_path,
         _build_default_config_template(_DEFAULT_SETTINGS), encoding="utf-8"
     )
 
@@ -811,7 +899,7 @@ def migrate_config(config_path: Path | None = None) -> MigrationResult:
         kept_lines = normalized
 
         updated_text = "\n".join(kept_lines).rstrip("\n") + "\n"
-        config_path.write_text(updated_text, encoding="utf-8")
+        _write_config_text(config_path, updated_text, encoding="utf-8")
 
     def _remove_top_level_keys(keys: set[str]) -> bool:
         nonlocal removed_keys
@@ -832,7 +920,7 @@ def migrate_config(config_path: Path | None = None) -> MigrationResult:
             updated_text = "\n".join(cleaned_lines)
             if text.endswith("\n"):
                 updated_text += "\n"
-            config_path.write_text(updated_text, encoding="utf-8")
+            _write_config_text(config_path, updated_text, encoding="utf-8")
         return removed
 
     def _migration_openai_legacy(config_data: Mapping[str, Any]) -> None:
@@ -941,7 +1029,7 @@ def migrate_config(config_path: Path | None = None) -> MigrationResult:
         if update_config_value(config_path, "schema_version", to_version):
             updated_keys.append("schema_version")
         current_version = to_version
-        data = tomllib.loads(config_path.read_text(encoding="utf-8"))  # type: ignore[union-attr]
+        data = _read_toml(config_path)
 
     return MigrationResult(
         config_path=config_path.resolve(),
@@ -984,7 +1072,7 @@ def normalize_config(config_path: Path | None = None) -> NormalizeResult:
     backup_path = config_path.with_name(config_path.name + ".bak")
     if not backup_path.exists():
         backup_path.write_text(original_text, encoding="utf-8")
-    config_path.write_text(rendered, encoding="utf-8")
+    _write_config_text(config_path, rendered, encoding="utf-8")
     return NormalizeResult(
         config_path=config_path.resolve(),
         backup_path=backup_path.resolve(),
@@ -59,3 +59,10 @@ CREATE TABLE IF NOT EXISTS directory_state (
     aggregated_mtime_ns INTEGER NOT NULL,
     last_seen_at INTEGER NOT NULL
 );
+
+CREATE TABLE IF NOT EXISTS notes_index (
+    file_path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    citekey TEXT
+);
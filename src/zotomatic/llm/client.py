@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import atexit
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Mapping
@@ -23,6 +25,40 @@ from .types import (
     LLMTagsContext,
 )
 
+# (base_url, headers, timeout) ごとに httpx.Client を共有し、keep-alive 接続を使い回す
+_HttpClientKey = tuple[str, tuple[tuple[str, str], ...], float]
+_HTTP_CLIENTS: dict[_HttpClientKey, httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_http_client(
+    base_url: str, headers: Mapping[str, str], timeout: float
+) -> httpx.Client:
+    """共有プールから httpx.Client を返す。無い・閉じている場合は作り直す。"""
+    key = (base_url, tuple(sorted(headers.items())), timeout)
+    with _HTTP_CLIENTS_LOCK:
+        client = _HTTP_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                base_url=base_url, headers=dict(headers), timeout=timeout
+            )
+            _HTTP_CLIENTS[key] = client
+        return client
+
+
+def _close_http_clients() -> None:
+    with _HTTP_CLIENTS_LOCK:
+        clients = list(_HTTP_CLIENTS.values())
+        _HTTP_CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:  # pragma: no cover - 終了処理のため握りつぶす
+            pass
+
+
+atexit.register(_close_http_clients)
+
 
 # --- LLM client base. ---
 class BaseLLMClient(ABC):
@@ -319,25 +355,19 @@ class OpenAILLMClient(BaseLLMClient):
     def __init__(self, config: LLMClientConfig):
         super().__init__(config)
         base_url = (config.base_url or "https://api.openai.com/v1").rstrip("/")
-        self._http_client = httpx.Client(
-            base_url=base_url,
-            headers={
+        self._http_client = _get_http_client(
+            base_url,
+            {
                 "Authorization": f"Bearer {config.api_key}",
                 "Content-Type": "application/json",
             },
-            timeout=config.timeout,
+            config.timeout,
         )
 
     def _close(self):
         """Implementation of BaseLLMClient._close()"""
-        try:
-            self._http_client.close()
-            # TODO: エラー処理
-        except NotImplementedError:
-            self._logger.debug("%s does not implement _close", type(self).__name__)
-        except:
-            # TODO: Internal error.
-            self._logger.debug("Internal errors occurred at %s", type(self).__name__)
+        # 共有プールの接続は他のインスタンスも使うため、終了時にまとめて閉じる
+        return None
 
     def _chat_completion(
         self,
@@ -385,23 +415,19 @@ class GeminiLLMClient(BaseLLMClient):
         base_url = (
             config.base_url or "https://generativelanguage.googleapis.com/v1beta"
         ).rstrip("/")
-        self._http_client = httpx.Client(
-            base_url=base_url,
-            headers={
+        self._http_client = _get_http_client(
+            base_url,
+            {
                 "x-goog-api-key": config.api_key,
                 "Content-Type": "application/json",
             },
-            timeout=config.timeout,
+            config.timeout,
         )
 
     def _close(self):
         """Implementation of BaseLLMClient._close()"""
-        try:
-            self._http_client.close()
-        except NotImplementedError:
-            self._logger.debug("%s does not implement _close", type(self).__name__)
-        except:
-            self._logger.debug("Internal errors occurred at %s", type(self).__name__)
+        # 共有プールの接続は他のインスタンスも使うため、終了時にまとめて閉じる
+        return None
 
     def _chat_completion(
         self,
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -32,7 +33,6 @@ class NoteBuilder:
                 ),
             )
         self._config = config
-        self._template_cache: str | None = None
 
     # TODO: apiの実装に備えてnote生成をコンテキストに依存せずに行えるようにする
     # TODO: 純粋なノート生成処理と論文PDFからのノート生成は分けて考えてcitekeyなどに依存せず動けるようにする？
@@ -82,16 +82,14 @@ class NoteBuilder:
             ) from exc
 
     def _load_template(self) -> str:
-        if self._template_cache is not None:
-            return self._template_cache
+        template_path = self._config.template_path
         try:
-            template_text = self._config.template_path.read_text(encoding="utf-8")
+            stat = template_path.stat()
+            return _read_template(str(template_path), stat.st_mtime_ns, stat.st_size)
         except OSError as exc:  # pragma: no cover - filesystem dependent
             raise ZotomaticNoteRepositoryError(
-                f"Failed to load note template: {self._config.template_path}"
+                f"Failed to load note template: {template_path}"
             ) from exc
-        self._template_cache = template_text
-        return template_text
 
     def _prepare_context(self, context: NoteBuilderContext) -> dict[str, Any]:
         # 既存タグと生成されたタグのマージ
@@ -200,11 +198,32 @@ def stub_insert_tags(): ...
 
 
 def _render_filename_pattern(pattern: str, context: dict[str, Any]) -> str:
-    def replacer(match: re.Match[str]) -> str:
-        key = match.group(1)
-        return str(context.get(key, ""))
-
-    return _FILENAME_TOKEN.sub(replacer, pattern)
+    return "".join(
+        text if key is None else str(context.get(key, ""))
+        for text, key in _compile_filename_pattern(pattern)
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_filename_pattern(pattern: str) -> tuple[tuple[str, str | None], ...]:
+    """ファイル名パターンを (文字列, None) / ("", キー) の列へ分解してキャッシュする。"""
+    parts: list[tuple[str, str | None]] = []
+    pos = 0
+    for match in _FILENAME_TOKEN.finditer(pattern):
+        if match.start() > pos:
+            parts.append((pattern[pos : match.start()], None))
+        parts.append(("", match.group(1)))
+        pos = match.end()
+    if pos < len(pattern):
+        parts.append((pattern[pos:], None))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=8)
+def _read_template(path: str, _mtime_ns: int, _size: int) -> str:
+    # (path, mtime, size) が同じ間はテンプレートを読み直さない
+    with open(path, encoding="utf-8") as handle:
+        return handle.read()
 
 
 def _sanitize_relative_path(value: str) -> Path:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from zotomatic.errors import ZotomaticNoteWorkflowError
 from zotomatic.llm.client import BaseLLMClient
@@ -24,6 +26,10 @@ from zotomatic.utils.note import (
     update_frontmatter_value,
 )
 
+_STATUS_PENDING = sys.intern("pending")
+_STATUS_DONE = sys.intern("done")
+_MODE_QUICK = sys.intern("quick")
+
 
 class NoteWorkflow:
     """ノート生成/更新のワークフローをまとめる。"""
@@ -42,7 +48,7 @@ class NoteWorkflow:
         self._llm_client = llm_client
         self._summary_enabled = config.summary_enabled
         self._tag_enabled = config.tag_enabled
-        self._summary_mode = config.summary_mode or "quick"
+        self._summary_mode = config.summary_mode or _MODE_QUICK
         self._logger = logger
         self._note_updater = NoteUpdater(note_builder=note_builder, logger=logger)
         self._llm_usage = llm_usage
@@ -63,36 +69,40 @@ class NoteWorkflow:
         except OSError:
             text = ""
         meta = parse_frontmatter(text)
-        summary_status = str(meta.get("zotomatic_summary_status", "pending")).strip()
-        tag_status = str(meta.get("zotomatic_tag_status", "pending")).strip()
-        summary_should_regen = self._summary_enabled and summary_status == "pending"
-        tag_should_regen = self._tag_enabled and tag_status == "pending"
+        summary_status = sys.intern(
+            str(meta.get("zotomatic_summary_status", _STATUS_PENDING)).strip()
+        )
+        tag_status = sys.intern(
+            str(meta.get("zotomatic_tag_status", _STATUS_PENDING)).strip()
+        )
+        summary_should_regen = (
+            self._summary_enabled and summary_status == _STATUS_PENDING
+        )
+        tag_should_regen = self._tag_enabled and tag_status == _STATUS_PENDING
 
         if not summary_should_regen and not tag_should_regen:
             return False
 
         builder_context = context.builder_context
+        updates: dict[str, Any] = {}
         if not summary_should_regen:
-            builder_context = builder_context.with_updates(
+            updates.update(
                 generated_summary=extract_summary_block(text),
                 zotomatic_summary_status=summary_status,
                 zotomatic_summary_mode=str(meta.get("zotomatic_summary_mode", "")),
             )
         tags = parse_tags(str(meta.get("tags", "")))
         if tags:
-            builder_context = builder_context.with_updates(tags=tags)
+            updates["tags"] = tags
         if not tag_should_regen:
-            builder_context = builder_context.with_updates(
-                zotomatic_tag_status=tag_status,
-            )
+            updates["zotomatic_tag_status"] = tag_status
         if summary_should_regen:
-            builder_context = self._maybe_generate_summary(builder_context)
+            updates.update(self._summary_updates(builder_context))
         if tag_should_regen:
-            builder_context = self._maybe_generate_tags(builder_context)
+            updates.update(self._tag_updates(builder_context))
+        updates["zotomatic_last_updated"] = datetime.now(timezone.utc).isoformat()
 
-        builder_context = builder_context.with_updates(
-            zotomatic_last_updated=datetime.now(timezone.utc).isoformat(),
-        )
+        builder_context = builder_context.with_updates(**updates)
         self._note_updater.update_existing(context=builder_context, existing=existing)
         print(f"Note updated: {existing}")
         return True
@@ -126,15 +136,12 @@ class NoteWorkflow:
         return True
 
     def _apply_ai(self, context: NoteBuilderContext) -> NoteBuilderContext:
-        context = self._maybe_generate_summary(context)
-        context = self._maybe_generate_tags(context)
-        return context.with_updates(
-            zotomatic_last_updated=datetime.now(timezone.utc).isoformat(),
-        )
+        updates = self._summary_updates(context)
+        updates.update(self._tag_updates(context))
+        updates["zotomatic_last_updated"] = datetime.now(timezone.utc).isoformat()
+        return context.with_updates(**updates)
 
-    def _maybe_generate_summary(
-        self, context: NoteBuilderContext
-    ) -> NoteBuilderContext:
+    def _summary_updates(self, context: NoteBuilderContext) -> dict[str, Any]:
         if self._summary_enabled and self._llm_client:
             if self._llm_usage and not self._llm_usage.can_run("summary"):
                 used = self._llm_usage.get_total_used()
@@ -144,8 +151,8 @@ class NoteWorkflow:
                     used,
                     limit,
                 )
-                return context.with_updates(
-                    zotomatic_summary_status="pending",
+                return dict(
+                    zotomatic_summary_status=_STATUS_PENDING,
                     zotomatic_summary_mode=self._summary_mode,
                 )
             try:
@@ -157,9 +164,9 @@ class NoteWorkflow:
                 if summary_result and summary_text:
                     if self._llm_usage:
                         self._llm_usage.record_success("summary")
-                    return context.with_updates(
+                    return dict(
                         generated_summary=summary_text,
-                        zotomatic_summary_status="done",
+                        zotomatic_summary_status=_STATUS_DONE,
                         zotomatic_summary_mode=self._summary_mode,
                     )
             except NotImplementedError:  # pragma: no cover
@@ -171,15 +178,15 @@ class NoteWorkflow:
                     "Summary generation failed; leaving status pending"
                 )
         elif not self._summary_enabled:
-            return context.with_updates(
-                zotomatic_summary_status="pending",
+            return dict(
+                zotomatic_summary_status=_STATUS_PENDING,
                 zotomatic_summary_mode="",
             )
         else:
-            return context.with_updates(zotomatic_summary_mode=self._summary_mode)
-        return context
+            return dict(zotomatic_summary_mode=self._summary_mode)
+        return {}
 
-    def _maybe_generate_tags(self, context: NoteBuilderContext) -> NoteBuilderContext:
+    def _tag_updates(self, context: NoteBuilderContext) -> dict[str, Any]:
         if self._tag_enabled and self._llm_client:
             if self._llm_usage and not self._llm_usage.can_run("tag"):
                 used = self._llm_usage.get_total_used()
@@ -189,16 +196,16 @@ class NoteWorkflow:
                     used,
                     limit,
                 )
-                return context.with_updates(zotomatic_tag_status="pending")
+                return dict(zotomatic_tag_status=_STATUS_PENDING)
             try:
                 tag_context = LLMTagsContext.from_note_builder_context(context)
                 tag_result = self._llm_client.generate_tags(tag_context)
                 if tag_result and tag_result.tags:
                     if self._llm_usage:
                         self._llm_usage.record_success("tag")
-                    return context.with_updates(
+                    return dict(
                         generated_tags=tag_result.tags,
-                        zotomatic_tag_status="done",
+                        zotomatic_tag_status=_STATUS_DONE,
                     )
             except NotImplementedError:  # pragma: no cover
                 self._logger.debug(
@@ -207,5 +214,5 @@ class NoteWorkflow:
             except Exception:  # pragma: no cover
                 self._logger.exception("Tag generation failed; leaving status pending")
         elif not self._tag_enabled:
-            return context.with_updates(zotomatic_tag_status="pending")
-        return context
+            return dict(zotomatic_tag_status=_STATUS_PENDING)
+        return {}
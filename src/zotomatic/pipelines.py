@@ -5,6 +5,7 @@ import subprocess
 import sys
 import threading
 import time
+from collections import OrderedDict
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
@@ -41,6 +42,8 @@ from zotomatic.services import (
 from zotomatic.watcher import PDFStorageWatcher, WatcherConfig
 from zotomatic.zotero import ZoteroClient, ZoteroClientConfig
 
+_CONTEXT_CACHE_SIZE = 4096
+
 
 def _merge_config(cli_options: Mapping[str, Any] | None) -> dict[str, Any]:
     return config.get_config(cli_options or {})
@@ -72,7 +75,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
 
     # repositoryの準備
     note_repository = NoteRepository.from_settings(settings)
-    citekey_index = note_repository.build_citekey_index()
+    citekey_index: dict[str, Path] = {}
     note_builder = NoteBuilder(
         repository=note_repository,
         config=NoteBuilderConfig.from_settings(settings),
@@ -141,13 +144,47 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
     error_count = 0
     error_paths: list[Path] = []
 
-    def _process_pdf(pdf_path: Path) -> None:
-        nonlocal created_count, updated_count, skipped_count
-        pdf_path = Path(pdf_path)
+    # (pdf_path, mtime_ns) -> context。リトライ時のZotero再問い合わせを避ける。
+    context_cache: OrderedDict[tuple[str, int], NoteBuilderContext] = OrderedDict()
+    context_cache_lock = threading.Lock()
+
+    def _context_cache_key(pdf_path: Path) -> tuple[str, int] | None:
+        try:
+            return (str(pdf_path), pdf_path.stat().st_mtime_ns)
+        except OSError:
+            return None
+
+    def _build_context(pdf_path: Path) -> NoteBuilderContext:
+        key = _context_cache_key(pdf_path)
+        if key is not None:
+            with context_cache_lock:
+                cached = context_cache.get(key)
+                if cached is not None:
+                    context_cache.move_to_end(key)
+                    return cached
         context = zotero_client.build_context(pdf_path) or NoteBuilderContext(
             title=pdf_path.stem,
             pdf_path=str(pdf_path),
         )
+        # Zotero未登録のフォールバックは後で解決され得るためキャッシュしない
+        if key is not None and context.citekey:
+            with context_cache_lock:
+                context_cache[key] = context
+                if len(context_cache) > _CONTEXT_CACHE_SIZE:
+                    context_cache.popitem(last=False)
+        return context
+
+    def _invalidate_context(pdf_path: Path) -> None:
+        key = _context_cache_key(pdf_path)
+        if key is None:
+            return
+        with context_cache_lock:
+            context_cache.pop(key, None)
+
+    def _process_pdf(pdf_path: Path) -> None:
+        nonlocal created_count, updated_count, skipped_count
+        pdf_path = Path(pdf_path)
+        context = _build_context(pdf_path)
 
         citekey = context.citekey
         if citekey:
@@ -162,6 +199,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
                     )
                 ):
                     updated_count += 1
+                    _invalidate_context(pdf_path)
                     _notify_llm_limit_reached()
                     return
                 if note_workflow.update_pending_note(
@@ -171,6 +209,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
                     )
                 ):
                     updated_count += 1
+                    _invalidate_context(pdf_path)
                     _notify_llm_limit_reached()
                     return
                 logger.debug(
@@ -186,6 +225,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
             NoteWorkflowContext(builder_context=context)
         )
         created_count += 1
+        _invalidate_context(pdf_path)
         if citekey:
             citekey_index[citekey] = note.path
             print(f"Note created: {note.path}")
@@ -218,6 +258,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
                 f"Invalid PDF path(s): {invalid_list}",
                 hint="Pass existing PDF file paths to --path.",
             )
+        citekey_index = note_repository.build_citekey_index()
         print(f"Scan started ({scan_mode_label}).")
         for path in expanded_paths:
             try:
@@ -246,11 +287,11 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
 
     # pdf_repository = PDFRepository.from_settings(settings)
     state_repository = WatcherStateRepository.from_settings(settings)
+    citekey_index = note_repository.build_citekey_index(
+        index_store=state_repository.note_index
+    )
     pending_queue = PendingQueue.from_state_repository(state_repository)
     pending_processor_config = PendingQueueProcessorConfig()
-    seed_batch_limit = pending_processor_config.batch_limit
-    pending_seed_buffer: list[Path] = []
-    pending_seed_lock = threading.Lock()
     runtime_seed_complete = False
     boot_seed_complete = state_repository.meta.get("boot_seed_complete") == "1"
     initial_scan_announced = False
@@ -260,12 +301,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
 
     def _on_pdf_created(pdf_path):
         logger.debug("Watcher detected %s", pdf_path)
-        pdf_path = Path(pdf_path)
-        if boot_seed_complete:
-            pending_queue.enqueue(pdf_path)
-            return
-        with pending_seed_lock:
-            pending_seed_buffer.append(pdf_path)
+        pending_queue.enqueue(Path(pdf_path))
 
     def _on_initial_scan_complete() -> None:
         nonlocal runtime_seed_complete
@@ -286,6 +322,7 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
         state_repository=state_repository,
         on_initial_scan_complete=_on_initial_scan_complete,
         force_scan=scan_force,
+        initial_batch_callback=pending_queue.enqueue_many,
     )
 
     zotero_resolver = ZoteroResolver.from_state_repository(
@@ -307,16 +344,10 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
         logger.debug("Scan watcher running.")
         try:
             while True:
-                if not boot_seed_complete:
-                    with pending_seed_lock:
-                        seed_batch = pending_seed_buffer[:seed_batch_limit]
-                        del pending_seed_buffer[:seed_batch_limit]
-                    for path in seed_batch:
-                        pending_queue.enqueue(path)
-                    if runtime_seed_complete and not pending_seed_buffer:
-                        state_repository.meta.set("boot_seed_complete", "1")
-                        boot_seed_complete = True
-                        logger.debug("Pending queue boot seed completed.")
+                if not boot_seed_complete and runtime_seed_complete:
+                    state_repository.meta.set("boot_seed_complete", "1")
+                    boot_seed_complete = True
+                    logger.debug("Pending queue boot seed completed.")
 
                 processed = pending_processor.run_once()
                 if processed:
@@ -326,7 +357,6 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
                     not scan_once
                     and runtime_seed_complete
                     and boot_seed_complete
-                    and not pending_seed_buffer
                     and not pending_queue.get_due(limit=1)
                 ):
                     if not initial_processing_announced:
@@ -342,7 +372,6 @@ def run_scan(cli_options: Mapping[str, Any] | None = None):
                     if (
                         runtime_seed_complete
                         and boot_seed_complete
-                        and not pending_seed_buffer
                         and no_due
                     ):
                         print("Scan completed.")
@@ -427,30 +456,22 @@ def run_init(cli_options: Mapping[str, Any] | None = None):
 
     llm_provider = cli_options.get("llm_provider")
     if llm_provider:
-        provider = str(llm_provider).strip().lower()
+        provider = sys.intern(str(llm_provider).strip().lower())
         if provider not in LLM_PROVIDER_DEFAULTS:
             logger.error("Unsupported LLM provider: %s", provider)
             return
-        updated = config.update_config_section_value(
-            init_result.config_path, "llm", "provider", provider
-        )
         defaults = LLM_PROVIDER_DEFAULTS.get(provider, {})
-        model = defaults.get("model")
-        base_url = defaults.get("base_url")
-        if model:
-            config.update_config_section_value(
-                init_result.config_path,
-                f"llm.providers.{provider}",
-                "model",
-                model,
-            )
-        if base_url:
-            config.update_config_section_value(
-                init_result.config_path,
-                f"llm.providers.{provider}",
-                "base_url",
-                base_url,
-            )
+        provider_updates = {
+            key: defaults[key] for key in ("model", "base_url") if defaults.get(key)
+        }
+        changed = config.apply_updates(
+            init_result.config_path,
+            {
+                "llm": {"provider": provider},
+                f"llm.providers.{provider}": provider_updates,
+            },
+        )
+        updated = "llm.provider" in changed
         config.normalize_config(init_result.config_path)
         if updated:
             print(f"Config updated: llm.provider={provider}")
@@ -886,7 +907,7 @@ def run_llm_set(cli_options: Mapping[str, Any] | None = None):
         logger.error("Missing required option: --provider")
         return
 
-    provider = str(llm_provider).strip().lower()
+    provider = sys.intern(str(llm_provider).strip().lower())
     if provider not in LLM_PROVIDER_DEFAULTS:
         logger.error("Unsupported LLM provider: %s", provider)
         return
@@ -895,17 +916,10 @@ def run_llm_set(cli_options: Mapping[str, Any] | None = None):
     model = cli_options.get("llm_model") or defaults.get("model")
     base_url = cli_options.get("llm_base_url") or defaults.get("base_url")
 
-    updates: list[str] = []
-    if config.update_config_section_value(config_path, "llm", "provider", provider):
-        updates.append("llm.provider")
+    provider_section = f"llm.providers.{provider}"
+    provider_updates: dict[str, Any] = {}
     if api_key is not None:
-        if config.update_config_section_value(
-            config_path,
-            f"llm.providers.{provider}",
-            "api_key",
-            api_key,
-        ):
-            updates.append(f"llm.providers.{provider}.api_key")
+        provider_updates["api_key"] = api_key
     else:
         provider_settings = {}
         llm_section = settings.get("llm")
@@ -922,21 +936,14 @@ def run_llm_set(cli_options: Mapping[str, Any] | None = None):
                 f"ZOTOMATIC_LLM_{provider.upper()}_API_KEY to enable LLM calls."
             )
     if model:
-        if config.update_config_section_value(
-            config_path,
-            f"llm.providers.{provider}",
-            "model",
-            model,
-        ):
-            updates.append(f"llm.providers.{provider}.model")
+        provider_updates["model"] = model
     if base_url:
-        if config.update_config_section_value(
-            config_path,
-            f"llm.providers.{provider}",
-            "base_url",
-            base_url,
-        ):
-            updates.append(f"llm.providers.{provider}.base_url")
+        provider_updates["base_url"] = base_url
+
+    updates = config.apply_updates(
+        config_path,
+        {"llm": {"provider": provider}, provider_section: provider_updates},
+    )
 
     if updates:
         print(f"LLM settings updated: {', '.join(updates)}")
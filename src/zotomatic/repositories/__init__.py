@@ -6,6 +6,7 @@ from .types import (
     DirectoryState,
     LLMUsageEntry,
     LLMUsageRepositoryConfig,
+    NoteIndexEntry,
     NoteRepositoryConfig,
     PDFRepositoryConfig,
     PendingEntry,
@@ -25,6 +26,7 @@ __all__ = [
     "LLMUsageEntry",
     "LLMUsageRepository",
     "LLMUsageRepositoryConfig",
+    "NoteIndexEntry",
     "PendingEntry",
     "WatcherStateRepository",
     "create_watcher_state_repository",
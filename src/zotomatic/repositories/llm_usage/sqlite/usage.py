@@ -25,7 +25,7 @@ class SqliteLLMUsageStore(SQLiteRepository, LLMUsageStore):
             FROM llm_usage
             WHERE usage_date = ?
         """
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(query, (usage_date,)).fetchone()
         if row is None:
             return None
@@ -56,5 +56,5 @@ class SqliteLLMUsageStore(SQLiteRepository, LLMUsageStore):
             entry.tag_count,
             entry.updated_at,
         )
-        with self._connect() as conn:
+        with self._txn() as conn:
             conn.execute(query, params)
@@ -1,14 +1,40 @@
 from __future__ import annotations
 
+import mmap
+import os
 import re
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from zotomatic.errors import ZotomaticNoteRepositoryError
+from zotomatic.errors import (
+    ZotomaticNoteRepositoryError,
+    ZotomaticWatcherStateRepositoryError,
+)
+from zotomatic.utils.fs import iter_file_entries, iter_file_paths
 
-from .types import NoteRepositoryConfig
+from .types import NoteIndexEntry, NoteRepositoryConfig
+from .watcher_state.repository import NoteIndexStore
+
+_CITEKEY_RE = re.compile(rb"^citekey:\s*(?P<value>.+)$", re.MULTILINE)
+_HEADER_READ_SIZE = 4096
+_INDEX_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_INDEX_BATCH_SIZE = 64
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(target: Path, data: bytes) -> None:
+    fd = os.open(target, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 
 @dataclass(slots=True)
@@ -19,6 +45,7 @@ class NoteRepository:
     _citekey_index: dict[str, Path] = field(
         init=False, default_factory=dict, repr=False
     )
+    _ensured_dirs: set[Path] = field(init=False, default_factory=set, repr=False)
 
     @classmethod
     def from_settings(cls, settings: Mapping[str, Any]) -> NoteRepository:
@@ -27,27 +54,58 @@ class NoteRepository:
     def resolve(self, relative_path: str | Path) -> Path:
         """ノートの保存先パスを返す（親ディレクトリを未作成なら確保）。"""
 
-        target = (self.config.root_dir / relative_path).expanduser()
-        target.parent.mkdir(parents=True, exist_ok=True)
+        target = self._join(relative_path)
+        self._ensure_dir(target.parent)
         return target
 
     def write(self, relative_path: str | Path, content: str) -> Path:
         """ノートをUTF-8で書き出し、書き込んだパスを返す。"""
 
         target = self.resolve(relative_path)
+        self._write_target(target, content)
+        return target
+
+    def _ensure_dir(self, directory: Path) -> None:
+        if directory in self._ensured_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(directory)
+
+    def _write_target(self, target: Path, content: str) -> None:
+        if os.linesep != "\n":
+            # write_text のテキストモードと同じ改行変換を保つ
+            content = content.replace("\n", os.linesep)
+        data = content.encode(self.config.encoding)
         try:
-            target.write_text(content, encoding=self.config.encoding)
+            try:
+                _write_bytes(target, data)
+            except FileNotFoundError:
+                # キャッシュ後に親ディレクトリが消された場合は作り直す
+                self._ensured_dirs.discard(target.parent)
+                self._ensure_dir(target.parent)
+                _write_bytes(target, data)
         except OSError as exc:  # pragma: no cover - filesystem dependent
             raise ZotomaticNoteRepositoryError(f"Failed to write note: {target}") from exc
-        return target
 
     def exists(self, relative_path: str | Path) -> bool:
         """指定ノートがすでに存在するか確認する。"""
 
-        return (self.config.root_dir / relative_path).expanduser().exists()
+        return self._join(relative_path).exists()
+
+    def _join(self, relative_path: str | Path) -> Path:
+        # root_dir は設定側で展開済み。"~" で始まる指定のときだけ展開する
+        target = self.config.root_dir / relative_path
+        if os.fspath(relative_path).startswith("~"):
+            return target.expanduser()
+        return target
 
-    def build_citekey_index(self) -> dict[str, Path]:
-        """簡易的に既存ノートを走査して citekey → パスの辞書を返す。"""
+    def build_citekey_index(
+        self, index_store: NoteIndexStore | None = None
+    ) -> dict[str, Path]:
+        """
+        簡易的に既存ノートを走査して citekey → パスの辞書を返す。
+        index_storeを渡した場合、mtime/sizeが前回から変わっていないノートは読み直さない
+        """
 
         index: dict[str, Path] = {}
         root = self.config.root_dir
@@ -55,21 +113,118 @@ class NoteRepository:
             self._citekey_index = {}
             return index
 
-        pattern = re.compile(r"^citekey:\s*(?P<value>.+)$", re.MULTILINE)
+        if index_store is None:
+            note_paths = list(iter_file_paths(root, "*.md"))
+            citekeys = self._read_citekeys_parallel(note_paths)
+        else:
+            note_paths, citekeys = self._scan_with_index_store(root, index_store)
+        for note_path, citekey in zip(note_paths, citekeys):
+            if citekey:
+                index[citekey] = note_path
+        self._citekey_index = index
+        return index
 
-        for note_path in root.rglob("*.md"):
+    def _scan_with_index_store(
+        self, root: Path, index_store: NoteIndexStore
+    ) -> tuple[list[Path], list[str | None]]:
+        cached = {
+            os.fspath(entry.file_path): entry for entry in index_store.list_under(root)
+        }
+        note_paths: list[Path] = []
+        citekeys: list[str | None] = []
+        changed: list[tuple[int, int, int]] = []
+        for entry in iter_file_entries(root, "*.md"):
             try:
-                text = note_path.read_text(encoding=self.config.encoding)
+                stat = entry.stat()
             except OSError:
                 continue
-            match = pattern.search(text)
-            if not match:
+            previous = cached.pop(entry.path, None)
+            note_paths.append(Path(entry.path))
+            if (
+                previous is not None
+                and previous.mtime_ns == stat.st_mtime_ns
+                and previous.size == stat.st_size
+            ):
+                citekeys.append(previous.citekey)
                 continue
-            citekey = match.group("value").strip().strip('"')
-            if citekey:
-                index[citekey] = note_path
-        self._citekey_index = index
-        return index
+            changed.append((len(citekeys), stat.st_mtime_ns, stat.st_size))
+            citekeys.append(None)
+
+        fresh = self._read_citekeys_parallel([note_paths[i] for i, _, _ in changed])
+        updates: list[NoteIndexEntry] = []
+        for (position, mtime_ns, size), citekey in zip(changed, fresh):
+            citekeys[position] = citekey
+            updates.append(
+                NoteIndexEntry(
+                    file_path=note_paths[position],
+                    mtime_ns=mtime_ns,
+                    size=size,
+                    citekey=citekey,
+                )
+            )
+        try:
+            index_store.upsert_many(updates)
+            index_store.delete_many(cached)
+        except ZotomaticWatcherStateRepositoryError:  # pragma: no cover - sqlite dependent
+            pass
+        return note_paths, citekeys
+
+    def _read_citekeys_parallel(self, note_paths: list[Path]) -> list[str | None]:
+        batches = [
+            note_paths[start : start + _INDEX_BATCH_SIZE]
+            for start in range(0, len(note_paths), _INDEX_BATCH_SIZE)
+        ]
+        if len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_INDEX_MAX_WORKERS, len(batches))
+            ) as executor:
+                results = list(executor.map(self._read_citekeys, batches))
+        else:
+            results = [self._read_citekeys(batch) for batch in batches]
+        return [citekey for batch in results for citekey in batch]
+
+    def _read_citekeys(self, note_paths: list[Path]) -> list[str | None]:
+        return [self._read_citekey(path) for path in note_paths]
+
+    def _read_citekey(self, note_path: Path) -> str | None:
+        """frontmatter 先頭だけを読んで citekey を取り出す。"""
+
+        try:
+            fd = os.open(note_path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            head = os.read(fd, _HEADER_READ_SIZE)
+            if head.startswith(b"---"):
+                lines = head.splitlines()
+                if len(head) == _HEADER_READ_SIZE:
+                    # 末尾行は途中で切れている可能性があるため使わない
+                    lines.pop()
+                for line in lines[1:]:
+                    if line.rstrip() == b"---":
+                        return None
+                    if line.startswith(b"citekey:"):
+                        return self._decode_citekey(line[8:])
+            if len(head) < _HEADER_READ_SIZE:
+                # ファイル全体を読み終えている
+                match = _CITEKEY_RE.search(head)
+            else:
+                # 大きなノートはデコードせずmmap上で直接検索する
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    match = _CITEKEY_RE.search(mapped)
+                    if match:
+                        return self._decode_citekey(match.group("value"))
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+        if not match:
+            return None
+        return self._decode_citekey(match.group("value"))
+
+    def _decode_citekey(self, raw: bytes) -> str | None:
+        value = raw.decode(self.config.encoding, errors="replace")
+        return value.strip().strip('"') or None
 
     def find_by_citekey(self, citekey: str) -> Path | None:
         if not self._citekey_index:
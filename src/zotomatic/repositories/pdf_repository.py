@@ -6,21 +6,32 @@ PDFファイルリポジトリ
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from zotomatic.errors import ZotomaticPDFRepositoryError
+from zotomatic.utils.fs import iter_files
 
 from .types import PDFRepositoryConfig
 
+_RESOLVE_CACHE_SIZE = 4096
+
 
 @dataclass(slots=True)
 class PDFRepository:
     """PDFファイルへのアクセスを司るスタブ実装。"""
 
     config: PDFRepositoryConfig
+    _resolve_cache: OrderedDict[str, Path] = field(
+        init=False, repr=False, default_factory=OrderedDict
+    )
+    _resolve_lock: threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
 
     @classmethod
     def from_settings(cls, settings: Mapping[str, Any]) -> "PDFRepository":
@@ -32,7 +43,22 @@ class PDFRepository:
         candidate = Path(path).expanduser()
         if candidate.is_absolute():
             return candidate
-        return (self.config.library_dir / candidate).resolve()
+        library_dir = self.config.library_dir
+        if not library_dir.is_absolute():
+            # 相対ライブラリはカレントディレクトリ依存のためキャッシュしない
+            return (library_dir / candidate).resolve()
+        key = str(candidate)
+        with self._resolve_lock:
+            cached = self._resolve_cache.get(key)
+            if cached is not None:
+                self._resolve_cache.move_to_end(key)
+                return cached
+        resolved = (library_dir / candidate).resolve()
+        with self._resolve_lock:
+            self._resolve_cache[key] = resolved
+            if len(self._resolve_cache) > _RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+        return resolved
 
     def read_bytes(self, path: str | Path) -> bytes:
         """PDFファイルをバイナリで読み込む。"""
@@ -46,14 +72,12 @@ class PDFRepository:
             raise ZotomaticPDFRepositoryError(f"Failed to read PDF: {resolved}") from exc
 
     def list_pdfs(self) -> Iterable[Path]:
-        """ライブラリ直下のPDF一覧を返す。存在しない場合は空イテレータ。"""
+        """ライブラリ直下のPDF一覧をパス順で返す。存在しない場合は空。"""
 
         library_dir = self.config.library_dir
         if not library_dir.exists():
-            return ()
-        pattern = self.config.pattern
-        if self.config.recursive:
-            iterator = library_dir.rglob(pattern)
-        else:
-            iterator = library_dir.glob(pattern)
-        return sorted(iterator)
+            return []
+        paths = iter_files(
+            library_dir, self.config.name_matcher, recursive=self.config.recursive
+        )
+        return [Path(path) for path in sorted(paths)]
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Mapping
+from types import TracebackType
+from typing import Mapping
 
 from zotomatic.errors import ZotomaticWatcherStateRepositoryError
 
+# スキーマ適用済みのDBパス。同一プロセス内での再確認を省く
+_INITIALIZED_PATHS: set[Path] = set()
+_SCHEMA_CACHE: dict[Path, str] = {}
+# 後から追加されたテーブルも既存DBへ適用されるよう、全て揃っているかを確認する
+_REQUIRED_TABLES = ("files", "notes_index")
+
+
+def _load_schema(schema_path: Path) -> str:
+    """スキーマSQLを一度だけ読み込み、以降はキャッシュを返す。"""
+
+    cached = _SCHEMA_CACHE.get(schema_path)
+    if cached is not None:
+        return cached
+    if not schema_path.exists():
+        raise ZotomaticWatcherStateRepositoryError(
+            f"Schema file not found: {schema_path}"
+        )
+    schema_sql = schema_path.read_text(encoding="utf-8")
+    _SCHEMA_CACHE[schema_path] = schema_sql
+    return schema_sql
+
 
 class SQLiteConfig(ABC):
     @property
@@ -22,6 +44,10 @@ class SQLiteRepository:
 
     config: SQLiteConfig
     _schema_path: Path = field(init=False, repr=False)
+    _conn: sqlite3.Connection | None = field(init=False, default=None, repr=False)
+    _lock: threading.RLock = field(
+        init=False, default_factory=threading.RLock, repr=False
+    )
 
     def __post_init__(self) -> None:
         self._schema_path = (
@@ -37,22 +63,20 @@ class SQLiteRepository:
 
     def _ensure_initialized(self) -> None:
         sqlite_path = self.config.sqlite_path
+        if sqlite_path in _INITIALIZED_PATHS and sqlite_path.exists():
+            return
         sqlite_path.parent.mkdir(parents=True, exist_ok=True)
         needs_init = not sqlite_path.exists()
-        with sqlite3.connect(sqlite_path) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA foreign_keys = ON")
-            if needs_init or not self._has_table(conn, "files"):
+        with self._lock:
+            conn = self._connection()
+            if needs_init or not all(
+                self._has_table(conn, name) for name in _REQUIRED_TABLES
+            ):
                 self._apply_schema(conn)
+        _INITIALIZED_PATHS.add(sqlite_path)
 
     def _apply_schema(self, conn: sqlite3.Connection) -> None:
-        if not self._schema_path.exists():
-            raise ZotomaticWatcherStateRepositoryError(
-                f"Schema file not found: {self._schema_path}"
-            )
-        schema_sql = self._schema_path.read_text(encoding="utf-8")
-        conn.executescript(schema_sql)
+        conn.executescript(_load_schema(self._schema_path))
 
     def _has_table(self, conn: sqlite3.Connection, name: str) -> bool:
         row = conn.execute(
@@ -61,23 +85,105 @@ class SQLiteRepository:
         ).fetchone()
         return row is not None
 
-    @contextmanager
-    def _connect(self) -> Iterator[sqlite3.Connection]:
+    def _connection(self) -> sqlite3.Connection:
+        """接続を遅延生成し、インスタンスの寿命の間使い回す。"""
+
+        if self._conn is not None:
+            return self._conn
         try:
-            conn = sqlite3.connect(self.config.sqlite_path)
+            conn = sqlite3.connect(
+                self.config.sqlite_path,
+                check_same_thread=False,
+                isolation_level=None,
+            )
             conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA foreign_keys=ON")
         except sqlite3.Error as exc:
             raise ZotomaticWatcherStateRepositoryError(
                 f"Failed to open SQLite database: {self.config.sqlite_path}"
             ) from exc
+        self._conn = conn
+        return conn
+
+    def _txn(self) -> _Txn:
+        """書き込み用。BEGIN IMMEDIATE で書き込みロックを先に取る。"""
+        return _Txn(self, "BEGIN IMMEDIATE")
+
+    def _read(self) -> _Txn:
+        """単発の読み取り用。autocommit で実行し、WAL の読み取りをブロックしない。"""
+        return _Txn(self, None)
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _Txn:
+    """ロック取得とBEGIN/COMMITを行う軽量なコンテキストマネージャ。begin が None なら autocommit。"""
+
+    __slots__ = ("_repository", "_begin", "_conn")
+
+    def __init__(self, repository: SQLiteRepository, begin: str | None) -> None:
+        self._repository = repository
+        self._begin = begin
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        repository = self._repository
+        repository._lock.acquire()
         try:
-            yield conn
-            conn.commit()
+            conn = repository._connection()
+            if self._begin is not None:
+                conn.execute(self._begin)
         except sqlite3.Error as exc:
-            conn.rollback()
+            repository._lock.release()
             raise ZotomaticWatcherStateRepositoryError(
-                f"SQLite operation failed: {self.config.sqlite_path}"
+                f"SQLite operation failed: {repository.config.sqlite_path}"
             ) from exc
+        except BaseException:
+            repository._lock.release()
+            raise
+        self._conn = conn
+        return conn
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        repository = self._repository
+        conn = self._conn
+        assert conn is not None
+        self._conn = None
+        try:
+            if self._begin is None:
+                if isinstance(exc, sqlite3.Error):
+                    raise ZotomaticWatcherStateRepositoryError(
+                        f"SQLite operation failed: {repository.config.sqlite_path}"
+                    ) from exc
+                return False
+            if exc_type is None:
+                try:
+                    conn.execute("COMMIT")
+                    return False
+                except sqlite3.Error as commit_exc:
+                    exc = commit_exc
+            repository._rollback(conn)
+            if isinstance(exc, sqlite3.Error):
+                raise ZotomaticWatcherStateRepositoryError(
+                    f"SQLite operation failed: {repository.config.sqlite_path}"
+                ) from exc
+            return False
         finally:
-            conn.close()
+            repository._lock.release()
@@ -4,12 +4,23 @@ from __future__ import annotations
 
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping
 
 from zotomatic.errors import ZotomaticMissingSettingError
 from zotomatic.repositories.sqlite_base import SQLiteConfig
+from zotomatic.utils.fs import NameMatcher, compile_name_pattern
+
+
+def _expanded_path(value: str | os.PathLike[str]) -> Path:
+    """展開済みの Path はそのまま返し、必要な場合だけ Path 化と ~ 展開を行う。"""
+
+    if isinstance(value, Path):
+        if str(value).startswith("~"):
+            return value.expanduser()
+        return value
+    return Path(value).expanduser()
 
 
 # --- Config. ---
@@ -21,7 +32,9 @@ class NoteRepositoryConfig:
     encoding: str = "utf-8"
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "root_dir", Path(self.root_dir).expanduser())
+        root_dir = _expanded_path(self.root_dir)
+        if root_dir is not self.root_dir:
+            object.__setattr__(self, "root_dir", root_dir)
 
     @classmethod
     def from_settings(cls, settings: Mapping[str, Any]) -> NoteRepositoryConfig:
@@ -39,9 +52,13 @@ class PDFRepositoryConfig:
     library_dir: Path
     recursive: bool = True
     pattern: str = "*.pdf"
+    name_matcher: NameMatcher = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "library_dir", Path(self.library_dir).expanduser())
+        library_dir = _expanded_path(self.library_dir)
+        if library_dir is not self.library_dir:
+            object.__setattr__(self, "library_dir", library_dir)
+        object.__setattr__(self, "name_matcher", compile_name_pattern(self.pattern))
 
     @classmethod
     def from_settings(cls, settings: Mapping[str, Any]) -> PDFRepositoryConfig:
@@ -63,7 +80,9 @@ class WatcherStateRepositoryConfig(SQLiteConfig):
     sqlite_path: Path
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "sqlite_path", Path(self.sqlite_path).expanduser())
+        sqlite_path = _expanded_path(self.sqlite_path)
+        if sqlite_path is not self.sqlite_path:
+            object.__setattr__(self, "sqlite_path", sqlite_path)
 
     @classmethod
     def from_settings(cls, settings: Mapping[str, Any]) -> WatcherStateRepositoryConfig:
@@ -93,7 +112,9 @@ class LLMUsageRepositoryConfig(SQLiteConfig):
     sqlite_path: Path
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "sqlite_path", Path(self.sqlite_path).expanduser())
+        sqlite_path = _expanded_path(self.sqlite_path)
+        if sqlite_path is not self.sqlite_path:
+            object.__setattr__(self, "sqlite_path", sqlite_path)
 
     @classmethod
     def from_settings(cls, settings: Mapping[str, Any]) -> LLMUsageRepositoryConfig:
@@ -109,9 +130,17 @@ class WatcherFileState:
     size: int
     last_seen_at: int
     sha1: str | None = None
+    _path_str: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "file_path", Path(self.file_path).expanduser())
+        file_path = _expanded_path(self.file_path)
+        if file_path is not self.file_path:
+            object.__setattr__(self, "file_path", file_path)
+        object.__setattr__(self, "_path_str", str(file_path))
+
+    @property
+    def path_str(self) -> str:
+        return self._path_str
 
     @classmethod
     def from_path(
@@ -135,7 +164,9 @@ class DirectoryState:
     last_seen_at: int
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "dir_path", Path(self.dir_path).expanduser())
+        dir_path = _expanded_path(self.dir_path)
+        if dir_path is not self.dir_path:
+            object.__setattr__(self, "dir_path", dir_path)
 
     @classmethod
     def from_path(cls, dir_path: Path, aggregated_mtime_ns: int) -> DirectoryState:
@@ -158,7 +189,14 @@ class PendingEntry:
     last_error: str | None
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        object.__setattr__(self, "file_path", Path(self.file_path).expanduser())
+        file_path = _expanded_path(self.file_path)
+        if file_path is not self.file_path:
+            object.__setattr__(self, "file_path", file_path)
+
+    @property
+    def pdf_path(self) -> Path:
+        """正規化済みのPDFパス（呼び出し側で Path を作り直さないため）。"""
+        return self.file_path
 
 
 @dataclass(frozen=True, slots=True)
@@ -174,8 +212,26 @@ class ZoteroAttachmentState:
     last_seen_at: int
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        if self.file_path is not None:
-            object.__setattr__(self, "file_path", Path(self.file_path).expanduser())
+        if self.file_path is None:
+            return
+        file_path = _expanded_path(self.file_path)
+        if file_path is not self.file_path:
+            object.__setattr__(self, "file_path", file_path)
+
+
+@dataclass(frozen=True, slots=True)
+class NoteIndexEntry:
+    """citekey索引のキャッシュ。statの署名が変わらない限り再読込しない。"""
+
+    file_path: Path
+    mtime_ns: int
+    size: int
+    citekey: str | None
+
+    def __post_init__(self) -> None:  # type: ignore[override]
+        file_path = _expanded_path(self.file_path)
+        if file_path is not self.file_path:
+            object.__setattr__(self, "file_path", file_path)
 
 
 @dataclass(frozen=True, slots=True)
@@ -4,6 +4,7 @@ from .repository import (
     DirectoryStateStore,
     FileStateStore,
     MetaStore,
+    NoteIndexStore,
     PendingStore,
     WatcherStateRepository,
     ZoteroAttachmentStore,
@@ -14,6 +15,7 @@ __all__ = [
     "DirectoryStateStore",
     "FileStateStore",
     "MetaStore",
+    "NoteIndexStore",
     "PendingStore",
     "WatcherStateRepository",
     "ZoteroAttachmentStore",
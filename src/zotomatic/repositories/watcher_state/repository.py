@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
 from ..types import (
     DirectoryState,
+    NoteIndexEntry,
     PendingEntry,
     WatcherFileState,
     ZoteroAttachmentState,
@@ -24,6 +25,9 @@ class FileStateStore(ABC):
     @abstractmethod
     def upsert(self, state: WatcherFileState) -> None: ...
 
+    @abstractmethod
+    def upsert_many(self, states: Iterable[WatcherFileState]) -> None: ...
+
     @abstractmethod
     def get(self, path: str | Path) -> WatcherFileState | None: ...
 
@@ -43,6 +47,9 @@ class PendingStore(ABC):
     @abstractmethod
     def upsert(self, entry: PendingEntry) -> None: ...
 
+    @abstractmethod
+    def upsert_many(self, entries: Iterable[PendingEntry]) -> None: ...
+
     @abstractmethod
     def get(self, file_path: str | Path) -> PendingEntry | None: ...
 
@@ -67,6 +74,17 @@ class ZoteroAttachmentStore(ABC):
     def get(self, attachment_key: str) -> ZoteroAttachmentState | None: ...
 
 
+class NoteIndexStore(ABC):
+    @abstractmethod
+    def list_under(self, dir_path: str | Path) -> list[NoteIndexEntry]: ...
+
+    @abstractmethod
+    def upsert_many(self, entries: Iterable[NoteIndexEntry]) -> None: ...
+
+    @abstractmethod
+    def delete_many(self, file_paths: Iterable[str | Path]) -> None: ...
+
+
 class WatcherStateRepository(ABC):
     @property
     @abstractmethod
@@ -88,6 +106,10 @@ class WatcherStateRepository(ABC):
     @abstractmethod
     def zotero_attachment(self) -> ZoteroAttachmentStore: ...
 
+    @property
+    @abstractmethod
+    def note_index(self) -> NoteIndexStore: ...
+
     @classmethod
     def from_settings(cls, settings: Mapping[str, object]) -> "WatcherStateRepository":
         return create_watcher_state_repository(settings)
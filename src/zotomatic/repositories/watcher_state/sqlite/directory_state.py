@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Mapping
 
@@ -23,8 +24,8 @@ class SqliteDirectoryStateStore(SQLiteRepository, DirectoryStateStore):
                 aggregated_mtime_ns=excluded.aggregated_mtime_ns,
                 last_seen_at=excluded.last_seen_at
         """
-        params = (str(state.dir_path), state.aggregated_mtime_ns, state.last_seen_at)
-        with self._connect() as conn:
+        params = (os.fspath(state.dir_path), state.aggregated_mtime_ns, state.last_seen_at)
+        with self._txn() as conn:
             conn.execute(query, params)
 
     def get(self, dir_path: str | Path) -> DirectoryState | None:
@@ -34,8 +35,8 @@ class SqliteDirectoryStateStore(SQLiteRepository, DirectoryStateStore):
             FROM directory_state
             WHERE dir_path = ?
         """
-        with self._connect() as conn:
-            row = conn.execute(query, (str(resolved),)).fetchone()
+        with self._read() as conn:
+            row = conn.execute(query, (os.fspath(resolved),)).fetchone()
         if row is None:
             return None
         return DirectoryState(
@@ -2,12 +2,34 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Mapping
+from typing import Iterable, Mapping
 
 from ..repository import FileStateStore
 from ...types import WatcherFileState, WatcherStateRepositoryConfig
 from zotomatic.repositories.sqlite_base import SQLiteRepository
 
+_UPSERT_QUERY = """
+    INSERT INTO files (file_path, mtime_ns, size, sha1, last_seen_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        mtime_ns=excluded.mtime_ns,
+        size=excluded.size,
+        sha1=excluded.sha1,
+        last_seen_at=excluded.last_seen_at
+"""
+
+
+def _upsert_params(
+    state: WatcherFileState,
+) -> tuple[str, int, int, str | None, int]:
+    return (
+        state.path_str,
+        state.mtime_ns,
+        state.size,
+        state.sha1,
+        state.last_seen_at,
+    )
+
 
 class SqliteFileStateStore(SQLiteRepository, FileStateStore):
     """filesテーブルへのアクセスを担当する。"""
@@ -17,24 +39,15 @@ class SqliteFileStateStore(SQLiteRepository, FileStateStore):
         return cls(WatcherStateRepositoryConfig.from_settings(settings))
 
     def upsert(self, state: WatcherFileState) -> None:
-        query = """
-            INSERT INTO files (file_path, mtime_ns, size, sha1, last_seen_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(file_path) DO UPDATE SET
-                mtime_ns=excluded.mtime_ns,
-                size=excluded.size,
-                sha1=excluded.sha1,
-                last_seen_at=excluded.last_seen_at
-        """
-        params = (
-            str(state.file_path),
-            state.mtime_ns,
-            state.size,
-            state.sha1,
-            state.last_seen_at,
-        )
-        with self._connect() as conn:
-            conn.execute(query, params)
+        with self._txn() as conn:
+            conn.execute(_UPSERT_QUERY, _upsert_params(state))
+
+    def upsert_many(self, states: Iterable[WatcherFileState]) -> None:
+        params = [_upsert_params(state) for state in states]
+        if not params:
+            return
+        with self._txn() as conn:
+            conn.executemany(_UPSERT_QUERY, params)
 
     def get(self, path: str | Path) -> WatcherFileState | None:
         resolved = Path(path).expanduser()
@@ -43,8 +56,8 @@ class SqliteFileStateStore(SQLiteRepository, FileStateStore):
             FROM files
             WHERE file_path = ?
         """
-        with self._connect() as conn:
-            row = conn.execute(query, (str(resolved),)).fetchone()
+        with self._read() as conn:
+            row = conn.execute(query, (os.fspath(resolved),)).fetchone()
         if row is None:
             return None
         return WatcherFileState(
@@ -63,7 +76,7 @@ class SqliteFileStateStore(SQLiteRepository, FileStateStore):
             FROM files
             WHERE file_path LIKE ?
         """
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(query, (f"{prefix}%",)).fetchone()
         if row is None:
             return 0
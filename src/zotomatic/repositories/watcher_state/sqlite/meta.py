@@ -16,7 +16,7 @@ class SqliteMetaStore(SQLiteRepository, MetaStore):
 
     def get(self, key: str) -> str | None:
         query = "SELECT value FROM meta WHERE key = ?"
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(query, (key,)).fetchone()
         if row is None:
             return None
@@ -28,5 +28,5 @@ class SqliteMetaStore(SQLiteRepository, MetaStore):
             VALUES (?, ?)
             ON CONFLICT(key) DO UPDATE SET value=excluded.value
         """
-        with self._connect() as conn:
+        with self._txn() as conn:
             conn.execute(query, (key, value))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from zotomatic.repositories.sqlite_base import SQLiteRepository
+
+from ...types import NoteIndexEntry, WatcherStateRepositoryConfig
+from ..repository import NoteIndexStore
+
+
+class SqliteNoteIndexStore(SQLiteRepository, NoteIndexStore):
+    """notes_indexテーブルへのアクセスを担当する。"""
+
+    @classmethod
+    def from_settings(cls, settings: Mapping[str, object]) -> SqliteNoteIndexStore:
+        return cls(WatcherStateRepositoryConfig.from_settings(settings))
+
+    def list_under(self, dir_path: str | Path) -> list[NoteIndexEntry]:
+        prefix = f"{os.fspath(dir_path).rstrip(os.sep)}{os.sep}"
+        # LIKE は大文字小文字を区別せず _ / % も解釈するため、先頭一致は substr で厳密に比べる
+        query = """
+            SELECT file_path, mtime_ns, size, citekey
+            FROM notes_index
+            WHERE substr(file_path, 1, ?) = ?
+        """
+        with self._read() as conn:
+            rows = conn.execute(query, (len(prefix), prefix)).fetchall()
+        return [
+            NoteIndexEntry(
+                file_path=Path(row["file_path"]),
+                mtime_ns=row["mtime_ns"],
+                size=row["size"],
+                citekey=row["citekey"],
+            )
+            for row in rows
+        ]
+
+    def upsert_many(self, entries: Iterable[NoteIndexEntry]) -> None:
+        query = """
+            INSERT INTO notes_index (file_path, mtime_ns, size, citekey)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(file_path) DO UPDATE SET
+                mtime_ns=excluded.mtime_ns,
+                size=excluded.size,
+                citekey=excluded.citekey
+        """
+        params = [
+            (os.fspath(entry.file_path), entry.mtime_ns, entry.size, entry.citekey)
+            for entry in entries
+        ]
+        if not params:
+            return
+        with self._txn() as conn:
+            conn.executemany(query, params)
+
+    def delete_many(self, file_paths: Iterable[str | Path]) -> None:
+        params = [(os.fspath(path),) for path in file_paths]
+        if not params:
+            return
+        with self._txn() as conn:
+            conn.executemany("DELETE FROM notes_index WHERE file_path = ?", params)
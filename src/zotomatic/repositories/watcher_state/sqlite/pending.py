@@ -1,12 +1,43 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Mapping
+from typing import Iterable, Mapping
 
 from ..repository import PendingStore
 from ...types import PendingEntry, WatcherStateRepositoryConfig
 from zotomatic.repositories.sqlite_base import SQLiteRepository
 
+_UPSERT_QUERY = """
+    INSERT INTO pending (
+        file_path,
+        first_seen_at,
+        last_attempt_at,
+        next_attempt_at,
+        attempt_count,
+        last_error
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        last_attempt_at=excluded.last_attempt_at,
+        next_attempt_at=excluded.next_attempt_at,
+        attempt_count=excluded.attempt_count,
+        last_error=excluded.last_error
+"""
+
+
+def _upsert_params(
+    entry: PendingEntry,
+) -> tuple[str, int, int | None, int, int, str | None]:
+    return (
+        os.fspath(entry.file_path),
+        entry.first_seen_at,
+        entry.last_attempt_at,
+        entry.next_attempt_at,
+        entry.attempt_count,
+        entry.last_error,
+    )
+
 
 class SqlitePendingStore(SQLiteRepository, PendingStore):
     """pendingテーブルへのアクセスを担当する。"""
@@ -16,32 +47,15 @@ class SqlitePendingStore(SQLiteRepository, PendingStore):
         return cls(WatcherStateRepositoryConfig.from_settings(settings))
 
     def upsert(self, entry: PendingEntry) -> None:
-        query = """
-            INSERT INTO pending (
-                file_path,
-                first_seen_at,
-                last_attempt_at,
-                next_attempt_at,
-                attempt_count,
-                last_error
-            )
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(file_path) DO UPDATE SET
-                last_attempt_at=excluded.last_attempt_at,
-                next_attempt_at=excluded.next_attempt_at,
-                attempt_count=excluded.attempt_count,
-                last_error=excluded.last_error
-        """
-        params = (
-            str(entry.file_path),
-            entry.first_seen_at,
-            entry.last_attempt_at,
-            entry.next_attempt_at,
-            entry.attempt_count,
-            entry.last_error,
-        )
-        with self._connect() as conn:
-            conn.execute(query, params)
+        with self._txn() as conn:
+            conn.execute(_UPSERT_QUERY, _upsert_params(entry))
+
+    def upsert_many(self, entries: Iterable[PendingEntry]) -> None:
+        params = [_upsert_params(entry) for entry in entries]
+        if not params:
+            return
+        with self._txn() as conn:
+            conn.executemany(_UPSERT_QUERY, params)
 
     def get(self, file_path: str | Path) -> PendingEntry | None:
         resolved = Path(file_path).expanduser()
@@ -56,8 +70,8 @@ class SqlitePendingStore(SQLiteRepository, PendingStore):
             FROM pending
             WHERE file_path = ?
         """
-        with self._connect() as conn:
-            row = conn.execute(query, (str(resolved),)).fetchone()
+        with self._read() as conn:
+            row = conn.execute(query, (os.fspath(resolved),)).fetchone()
         if row is None:
             return None
         return PendingEntry(
@@ -83,7 +97,7 @@ class SqlitePendingStore(SQLiteRepository, PendingStore):
             ORDER BY next_attempt_at ASC
             LIMIT ?
         """
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(query, (timestamp, limit)).fetchall()
         return [
             PendingEntry(
@@ -110,7 +124,7 @@ class SqlitePendingStore(SQLiteRepository, PendingStore):
             ORDER BY next_attempt_at ASC
             LIMIT ?
         """
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(query, (limit,)).fetchall()
         return [
             PendingEntry(
@@ -126,7 +140,7 @@ class SqlitePendingStore(SQLiteRepository, PendingStore):
 
     def count_all(self) -> int:
         query = "SELECT COUNT(*) AS count FROM pending"
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(query).fetchone()
         if row is None:
             return 0
@@ -134,5 +148,5 @@ class SqlitePendingStore(SQLiteRepository, PendingStore):
 
     def delete(self, file_path: str | Path) -> None:
         resolved = Path(file_path).expanduser()
-        with self._connect() as conn:
-            conn.execute("DELETE FROM pending WHERE file_path = ?", (str(resolved),))
+        with self._txn() as conn:
+            conn.execute("DELETE FROM pending WHERE file_path = ?", (os.fspath(resolved),))
@@ -8,6 +8,7 @@ from ..repository import MetaStore, WatcherStateRepository
 from .directory_state import SqliteDirectoryStateStore
 from .file_state import SqliteFileStateStore
 from .meta import SqliteMetaStore
+from .note_index import SqliteNoteIndexStore
 from .pending import SqlitePendingStore
 from .zotero_attachment import SqliteZoteroAttachmentStore
 
@@ -21,6 +22,7 @@ class SqliteWatcherStateRepository(WatcherStateRepository):
     _pending: SqlitePendingStore
     _meta: SqliteMetaStore
     _zotero_attachment: SqliteZoteroAttachmentStore
+    _note_index: SqliteNoteIndexStore
 
     @classmethod
     def from_settings(
@@ -33,6 +35,7 @@ class SqliteWatcherStateRepository(WatcherStateRepository):
             _pending=SqlitePendingStore(config),
             _meta=SqliteMetaStore(config),
             _zotero_attachment=SqliteZoteroAttachmentStore(config),
+            _note_index=SqliteNoteIndexStore(config),
         )
 
     @property
@@ -54,3 +57,7 @@ class SqliteWatcherStateRepository(WatcherStateRepository):
     @property
     def zotero_attachment(self) -> SqliteZoteroAttachmentStore:
         return self._zotero_attachment
+
+    @property
+    def note_index(self) -> SqliteNoteIndexStore:
+        return self._note_index
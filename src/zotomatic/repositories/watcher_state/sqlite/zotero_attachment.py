@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Mapping
 from pathlib import Path
 
@@ -40,13 +41,13 @@ class SqliteZoteroAttachmentStore(SQLiteRepository, ZoteroAttachmentStore):
         params = (
             state.attachment_key,
             state.parent_item_key,
-            str(state.file_path) if state.file_path else None,
+            os.fspath(state.file_path) if state.file_path else None,
             state.mtime_ns,
             state.size,
             state.sha1,
             state.last_seen_at,
         )
-        with self._connect() as conn:
+        with self._txn() as conn:
             conn.execute(query, params)
 
     def get(self, attachment_key: str) -> ZoteroAttachmentState | None:
@@ -62,7 +63,7 @@ class SqliteZoteroAttachmentStore(SQLiteRepository, ZoteroAttachmentStore):
             FROM zotero_attachment
             WHERE attachment_key = ?
         """
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(query, (attachment_key,)).fetchone()
         if row is None:
             return None
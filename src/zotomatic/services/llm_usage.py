@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date
 from typing import Any
@@ -9,6 +10,26 @@ from zotomatic.errors import ZotomaticLLMUsageError
 from zotomatic.repositories import LLMUsageEntry, LLMUsageRepository
 
 
+def _coerce_str_limit(value: str) -> int | None:
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
+
+
+# 型ごとの上限値変換（bool や未知の型は上限なし扱い）
+_LIMIT_COERCERS: dict[type, Callable[[Any], int | None]] = {
+    int: lambda value: value,
+    float: int,
+    str: _coerce_str_limit,
+}
+
+
+def _coerce_limit(value: Any) -> int | None:
+    coercer = _LIMIT_COERCERS.get(type(value))
+    return coercer(value) if coercer is not None else None
+
+
 @dataclass(slots=True)
 class LLMUsageService:
     """日次のLLM使用回数を管理する。"""
@@ -18,7 +39,7 @@ class LLMUsageService:
     logger: Any
 
     def __post_init__(self) -> None:
-        self.daily_limit = self._coerce_limit(self.daily_limit)
+        self.daily_limit = _coerce_limit(self.daily_limit)
 
     def can_run(self, kind: str) -> bool:
         if self.daily_limit is None or self.daily_limit <= 0:
@@ -68,19 +89,3 @@ class LLMUsageService:
         )
         self.repository.usage.upsert(entry)
         return entry
-
-    def _coerce_limit(self, value: Any) -> int | None:
-        if value is None:
-            return None
-        if isinstance(value, bool):
-            return None
-        if isinstance(value, int):
-            return value
-        if isinstance(value, float):
-            return int(value)
-        if isinstance(value, str):
-            try:
-                return int(value.strip())
-            except ValueError:
-                return None
-        return None
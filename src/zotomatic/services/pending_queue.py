@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable
 from pathlib import Path
 
 from zotomatic.repositories import PendingEntry
@@ -31,6 +32,22 @@ class PendingQueue:
         )
         self._repository.upsert(entry)
 
+    def enqueue_many(self, file_paths: Iterable[str | Path]) -> None:
+        """初回スキャン結果などをまとめてキューへ追加する。"""
+
+        now = int(time.time())
+        self._repository.upsert_many(
+            PendingEntry(
+                file_path=Path(file_path),
+                first_seen_at=now,
+                last_attempt_at=None,
+                next_attempt_at=now,
+                attempt_count=0,
+                last_error=None,
+            )
+            for file_path in file_paths
+        )
+
     def get_due(self, now: int | None = None, limit: int = 50) -> list[PendingEntry]:
         if now is None:
             now = int(time.time())
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import os
+import random
 import threading
 import time
 from collections.abc import Callable
@@ -8,6 +11,7 @@ from pathlib import Path
 import fitz
 
 from zotomatic.logging import get_logger
+from zotomatic.repositories import PendingEntry
 from zotomatic.services.pending_queue import PendingQueue
 from zotomatic.services.types import PendingQueueProcessorConfig
 from zotomatic.services.zotero_resolver import ZoteroResolver
@@ -24,6 +28,7 @@ class PendingQueueProcessor:
         *,
         config: PendingQueueProcessorConfig | None = None,
         stop_event: threading.Event | None = None,
+        rng: random.Random | None = None,
     ) -> None:
         self._queue = queue
         self._zotero_resolver = zotero_resolver
@@ -31,6 +36,7 @@ class PendingQueueProcessor:
         self._config = config or PendingQueueProcessorConfig()
         self._logger = get_logger(self._config.logger_name, False)
         self._stop_event = stop_event
+        self._rng = rng or random.Random()
         self._skipped_unreadable = 0
         self._dropped_count = 0
         self._dropped_paths: list[Path] = []
@@ -41,6 +47,7 @@ class PendingQueueProcessor:
         if limit is None:
             limit = self._config.batch_limit
         processed = 0
+        resolved_paths: list[str | Path] = []
         due_entries = self._queue.get_due(limit=limit)
         if due_entries:
             self._logger.info("Pending entries due: %s", len(due_entries))
@@ -48,53 +55,56 @@ class PendingQueueProcessor:
             self._logger.info(
                 "Zotero disabled; generating notes without metadata."
             )
+            existing = self._existing_paths(due_entries)
+            ready: list[tuple[PendingEntry, Path]] = []
             for entry in due_entries:
                 if self._stop_event and self._stop_event.is_set():
                     break
-                pdf_path = Path(entry.file_path)
-                if not pdf_path.exists():
+                pdf_path = entry.pdf_path
+                if pdf_path not in existing:
                     self._drop_permanent(entry.file_path, "PDF not found")
                     continue
                 if not self._is_pdf_readable(pdf_path):
                     self._drop_permanent(entry.file_path, "PDF is unreadable")
                     continue
-                try:
-                    self._on_resolved(pdf_path)
-                except Exception as exc:  # pragma: no cover - callback depends on caller
-                    self._backoff(
-                        entry.file_path,
-                        entry.attempt_count,
-                        str(exc),
-                        entry.attempt_count + 1,
-                    )
-                    continue
-                self._queue.resolve(entry.file_path)
-                processed += 1
-                self._logger.info("Pending entry resolved: %s", entry.file_path)
+                ready.append((entry, pdf_path))
+            processed = self._dispatch_resolved(ready, resolved_paths)
+            self._log_resolved(resolved_paths)
             return processed
+        candidates: list[tuple[PendingEntry, Path]] = []
+        existing = self._existing_paths(due_entries)
         for entry in due_entries:
             if self._stop_event and self._stop_event.is_set():
                 break
-            pdf_path = Path(entry.file_path)
-            if not pdf_path.exists():
+            pdf_path = entry.pdf_path
+            if pdf_path not in existing:
                 self._drop_permanent(entry.file_path, "PDF not found")
                 continue
             if not self._is_pdf_readable(pdf_path):
                 self._drop_permanent(entry.file_path, "PDF is unreadable")
                 continue
+            candidates.append((entry, pdf_path))
+        if not candidates:
+            return processed
 
-            try:
-                paper = self._zotero_resolver.resolve(pdf_path)
-            except Exception as exc:  # pragma: no cover - pyzotero runtime
+        # Zoteroの添付一覧はバッチ全体で1回だけ取得する
+        try:
+            papers = self._zotero_resolver.resolve_many(
+                [pdf_path for _, pdf_path in candidates]
+            )
+        except Exception as exc:  # pragma: no cover - pyzotero runtime
+            for entry, _ in candidates:
                 self._backoff(
                     entry.file_path,
                     entry.attempt_count,
                     str(exc),
                     entry.attempt_count + 1,
                 )
-                continue
+            return processed
 
-            if not paper:
+        ready = []
+        for entry, pdf_path in candidates:
+            if not papers.get(pdf_path):
                 self._backoff(
                     entry.file_path,
                     entry.attempt_count,
@@ -102,7 +112,25 @@ class PendingQueueProcessor:
                     entry.attempt_count + 1,
                 )
                 continue
+            ready.append((entry, pdf_path))
+        processed = self._dispatch_resolved(ready, resolved_paths)
+
+        self._log_resolved(resolved_paths)
+        if processed:
+            # 解決が進んだらZotero側も更新されている可能性があるため取り直す
+            self._zotero_resolver.invalidate_cache()
+        return processed
 
+    def _dispatch_resolved(
+        self,
+        ready: list[tuple[PendingEntry, Path]],
+        resolved_paths: list[str | Path],
+    ) -> int:
+        """on_resolved を順に呼び出し、結果に応じてキューを更新する。"""
+        processed = 0
+        for entry, pdf_path in ready:
+            if self._stop_event and self._stop_event.is_set():
+                break
             try:
                 self._on_resolved(pdf_path)
             except Exception as exc:  # pragma: no cover - callback depends on caller
@@ -113,11 +141,9 @@ class PendingQueueProcessor:
                     entry.attempt_count + 1,
                 )
                 continue
-
             self._queue.resolve(entry.file_path)
             processed += 1
-            self._logger.info("Pending entry resolved: %s", entry.file_path)
-
+            resolved_paths.append(entry.file_path)
         return processed
 
     @property
@@ -137,10 +163,12 @@ class PendingQueueProcessor:
                 error,
             )
             return
-        next_delay = min(
+        # full jitter: 同時にpendingへ入ったエントリの再試行時刻を分散させる
+        cap = min(
             self._config.max_delay_seconds,
             self._config.base_delay_seconds * (2 ** max(attempt_count, 0)),
         )
+        next_delay = self._rng.randint(0, cap)
         next_attempt_at = int(time.time()) + next_delay
         self._queue.update_attempt(
             file_path=file_path,
@@ -156,6 +184,15 @@ class PendingQueueProcessor:
             error,
         )
 
+    def _log_resolved(self, resolved_paths: list[str | Path]) -> None:
+        # 1件ずつではなくバッチ単位でまとめて出力する
+        if resolved_paths and self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Pending entries resolved (%d): %s",
+                len(resolved_paths),
+                ", ".join(map(str, resolved_paths)),
+            )
+
     def _drop_permanent(self, file_path: str | Path, reason: str) -> None:
         self._queue.resolve(file_path)
         self._dropped_count += 1
@@ -164,6 +201,24 @@ class PendingQueueProcessor:
             self._skipped_unreadable += 1
         self._logger.warning("Pending entry dropped: %s (%s)", file_path, reason)
 
+    @staticmethod
+    def _existing_paths(entries: list[PendingEntry]) -> set[Path]:
+        """親ディレクトリごとに1回だけ scandir し、存在するPDFパスを返す。"""
+        by_parent: dict[Path, list[Path]] = {}
+        for entry in entries:
+            pdf_path = entry.pdf_path
+            by_parent.setdefault(pdf_path.parent, []).append(pdf_path)
+        existing: set[Path] = set()
+        for parent, pdf_paths in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    names = {dir_entry.name for dir_entry in it}
+            except OSError:
+                existing.update(path for path in pdf_paths if path.exists())
+                continue
+            existing.update(path for path in pdf_paths if path.name in names)
+        return existing
+
     def _is_pdf_readable(self, pdf_path: Path) -> bool:
         """PDFファイル破損チェック"""
         try:
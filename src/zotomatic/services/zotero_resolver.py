@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Sequence
 from pathlib import Path
 
 from zotomatic.logging import get_logger
@@ -38,6 +39,32 @@ class ZoteroResolver:
         paper, attachment_key, parent_item_key = (
             self._client.get_paper_with_attachment_info(path)
         )
+        return self._record(path, paper, attachment_key, parent_item_key)
+
+    def resolve_many(
+        self, pdf_paths: Sequence[str | Path]
+    ) -> dict[Path, ZoteroPaper | None]:
+        """複数PDFをまとめて解決する。Zoteroの添付一覧取得は1回で済ませる。"""
+
+        paths = [Path(pdf_path) for pdf_path in pdf_paths]
+        infos = self._client.get_papers_with_attachment_info(paths)
+        return {
+            path: self._record(path, *infos.get(path, (None, None, None)))
+            for path in paths
+        }
+
+    def invalidate_cache(self) -> None:
+        """Zotero添付一覧のキャッシュを破棄する。"""
+
+        self._client.invalidate_attachments_cache()
+
+    def _record(
+        self,
+        path: Path,
+        paper: ZoteroPaper | None,
+        attachment_key: str | None,
+        parent_item_key: str | None,
+    ) -> ZoteroPaper | None:
         if not paper:
             return None
 
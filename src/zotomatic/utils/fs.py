@@ -0,0 +1,94 @@
+"""Filesystem walking helpers."""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Callable, Iterator
+from fnmatch import translate
+from pathlib import Path
+
+_WILDCARD_CHARS = frozenset("*?[")
+# Windows では大文字小文字を区別しない（Path.glob / fnmatch.fnmatch と同じ扱い）
+_normcase = os.path.normcase
+
+NameMatcher = Callable[[str], object]
+
+
+def compile_name_pattern(pattern: str) -> NameMatcher:
+    """ファイル名用のglobを判定関数へ変換する。``*.ext`` は末尾比較に特化する。"""
+
+    normcase = _normcase
+    case_sensitive = normcase("A") == "A"
+    if not case_sensitive:
+        pattern = normcase(pattern)
+    suffix = _simple_suffix(pattern)
+    if suffix is not None:
+        if case_sensitive:
+            return lambda name: name.endswith(suffix)
+        return lambda name: normcase(name).endswith(suffix)
+    match = re.compile(translate(pattern)).match
+    if case_sensitive:
+        return match
+    return lambda name: match(normcase(name))
+
+
+def iter_files(
+    root: str | os.PathLike[str],
+    pattern: str | NameMatcher = "*",
+    recursive: bool = True,
+) -> Iterator[str]:
+    """``os.scandir`` で root 配下のファイルを走査し、pattern に合うパス文字列を返す。"""
+
+    for entry in iter_file_entries(root, pattern, recursive):
+        yield entry.path
+
+
+def iter_file_entries(
+    root: str | os.PathLike[str],
+    pattern: str | NameMatcher = "*",
+    recursive: bool = True,
+) -> Iterator[os.DirEntry[str]]:
+    """iter_files と同じ走査で ``os.DirEntry`` を返す（stat の再利用向け）。"""
+
+    matches = compile_name_pattern(pattern) if isinstance(pattern, str) else pattern
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if matches(entry.name):
+                        yield entry
+        except OSError:
+            continue
+
+
+def iter_file_paths(
+    root: str | os.PathLike[str],
+    pattern: str | NameMatcher = "*",
+    recursive: bool = True,
+) -> Iterator[Path]:
+    """iter_files の結果を Path で返す。"""
+
+    return map(Path, iter_files(root, pattern, recursive))
+
+
+def _simple_suffix(pattern: str) -> str | None:
+    """``*.ext`` 形式なら ``.ext`` を返し、それ以外は None。"""
+
+    if not pattern.startswith("*"):
+        return None
+    suffix = pattern[1:]
+    if _WILDCARD_CHARS.intersection(suffix):
+        return None
+    return suffix
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import re
 import unicodedata
 
+# 先頭の frontmatter ブロックだけを切り出す（本文全体は分割しない）
+# 中身は省略可能（空の ``---\n---`` でも最初の閉じ行で止める）
+_FM_RE = re.compile(r"\A---[^\r\n]*\r?\n(?:(.*?)\r?\n)??---\r?(?:\n|\Z)", re.DOTALL)
+# tags: [a, "b"] 形式の角括弧の中身
+_BRACKETED_RE = re.compile(r"\A\s*\[(.*)\]\s*\Z", re.DOTALL)
+# タグ前後の空白と引用符を1回で取り除く
+_TAG_STRIP_CHARS = " \t\r\n\f\v\"'"
+# [!summary] callout 行から直後の引用行までをまとめて取り出す（位置は find で固定する）
+_SUMMARY_RE = re.compile(r"\[!summary\][^\n]*\n((?:>[^\n]*(?:\n|\Z))+)")
+
 
 def parse_frontmatter(text: str) -> dict[str, object]:
-    if not text.startswith("---"):
-        return {}
-    lines = text.splitlines()
-    try:
-        end_idx = lines[1:].index("---") + 1
-    except ValueError:
+    match = _FM_RE.match(text)
+    if not match:
         return {}
     meta: dict[str, object] = {}
-    for line in lines[1:end_idx]:
+    for line in (match.group(1) or "").splitlines():
         if ":" not in line:
             continue
         key, value = line.split(":", 1)
@@ -21,40 +28,38 @@ def parse_frontmatter(text: str) -> dict[str, object]:
 
 
 def parse_tags(value: str) -> tuple[str, ...]:
-    stripped = value.strip()
-    if not stripped.startswith("[") or not stripped.endswith("]"):
+    match = _BRACKETED_RE.match(value)
+    if not match:
         return ()
-    raw = stripped[1:-1].strip()
+    raw = match.group(1).strip()
     if not raw:
         return ()
     tags: list[str] = []
     for part in raw.split(","):
-        item = part.strip().strip('"').strip("'")
+        item = part.strip(_TAG_STRIP_CHARS)
         if item:
             tags.append(item)
     return tuple(tags)
 
 
 def normalize_path_value(value: str) -> str:
-    if not value:
+    # ASCII だけのパスは NFC でも変わらないので正規化を省く
+    if not value or value.isascii():
         return value
     return unicodedata.normalize("NFC", value)
 
 
 def extract_summary_block(text: str) -> str:
-    lines = text.splitlines()
-    summary_idx = None
-    for idx, line in enumerate(lines):
-        if "[!summary]" in line:
-            summary_idx = idx
-            break
-    if summary_idx is None:
+    # 最初の [!summary] だけを対象にし、後続の callout へは進まない
+    start = text.find("[!summary]")
+    if start < 0:
+        return ""
+    match = _SUMMARY_RE.match(text, start)
+    if not match:
         return ""
-    summary_lines: list[str] = []
-    for line in lines[summary_idx + 1 :]:
-        if not line.startswith(">"):
-            break
-        summary_lines.append(line.lstrip("> ").rstrip())
+    summary_lines = [
+        line.lstrip("> ").rstrip() for line in match.group(1).splitlines()
+    ]
     return "\n".join(summary_lines).strip()
 
 
@@ -69,8 +74,16 @@ def update_frontmatter_value(
     except ValueError:
         return text, False
 
+    if not _set_frontmatter_line(lines, end_idx, key, value):
+        return text, False
+    return _join_lines(lines, text), True
+
+
+def _set_frontmatter_line(
+    lines: list[str], end_idx: int, key: str, value: str
+) -> bool:
+    """frontmatter の行リストを直接書き換える。値が同じなら False。"""
     target_prefix = f"{key}:"
-    changed = False
     for idx in range(1, end_idx):
         line = lines[idx]
         stripped = line.lstrip()
@@ -79,19 +92,19 @@ def update_frontmatter_value(
         prefix = line[: len(line) - len(stripped)]
         current = stripped.split(":", 1)[1].strip()
         if current == value:
-            return text, False
+            return False
         lines[idx] = f"{prefix}{key}: {value}"
-        changed = True
-        break
+        return True
+
+    lines.insert(end_idx, f"{key}: {value}")
+    return True
 
-    if not changed:
-        lines.insert(end_idx, f"{key}: {value}")
-        changed = True
 
-    updated = "\n".join(lines)
-    if text.endswith("\n"):
-        updated += "\n"
-    return updated, True
+def _join_lines(lines: list[str], original: str) -> str:
+    joined = "\n".join(lines)
+    if original.endswith("\n"):
+        joined += "\n"
+    return joined
 
 
 def ensure_frontmatter_keys(
@@ -102,12 +115,21 @@ def ensure_frontmatter_keys(
     required_items = [(key, str(value)) for key, value in required.items()]
     if text.startswith("---"):
         meta = parse_frontmatter(text)
-        updated = text
-        for key, value in required_items:
-            if key in meta:
-                continue
-            updated, _ = update_frontmatter_value(updated, key, value)
-        return updated
+        missing = [(key, value) for key, value in required_items if key not in meta]
+        if not missing:
+            return text
+        # 不足キーをまとめて差し込み、分割と結合は1回で済ませる
+        lines = text.splitlines()
+        try:
+            end_idx = lines[1:].index("---") + 1
+        except ValueError:
+            return text
+        changed = False
+        for key, value in missing:
+            size = len(lines)
+            changed |= _set_frontmatter_line(lines, end_idx, key, value)
+            end_idx += len(lines) - size
+        return _join_lines(lines, text) if changed else text
 
     lines = ["---"]
     for key, value in required_items:
@@ -116,7 +138,4 @@ def ensure_frontmatter_keys(
     lines.append("")
     if text:
         lines.append(text.lstrip("\n"))
-    result = "\n".join(lines)
-    if text.endswith("\n"):
-        result += "\n"
-    return result
+    return _join_lines(lines, text)
@@ -16,6 +16,9 @@ LANG_HEADING_KEYWORDS = {
     "zh": ("摘要", "概述", "简介", "结论", "相关工作"),
 }
 
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_YEAR_CANDIDATE_RE = re.compile(r"(19|20)\d{2}")
+
 # TODO: 下記の見出し候補を言語拡張してから利用する
 SECTION_CANDIDATES = [
     r"abstract",
@@ -218,13 +221,13 @@ def _detect_language(lines: list[str]) -> str:
         return "ja"
     if any("摘要" in line for line in lines[:5]):
         return "zh"
-    if re.search(r"[\u4e00-\u9fff]", sample):
+    if _CJK_RE.search(sample):
         return "zh"
     return "en"
 
 
 def extract_year_candidate_from_text(text: str) -> Optional[str]:
-    match = re.search(r"(19|20)\d{2}", text)
+    match = _YEAR_CANDIDATE_RE.search(text)
     return match.group(0) if match else None
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 
 _SLUG_REGEX = re.compile(r"[^a-z0-9]+")
 _INVALID_FILENAME_CHARS = re.compile('[<>:"/\\\\|?*\x00-\x1F]')
@@ -18,11 +19,20 @@ _WINDOWS_RESERVED = {
 
 
 def slugify(value: str, max_length: int | None = None) -> str:
-    normalized = unicodedata.normalize("NFKD", value)
-    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-    ascii_text = ascii_text.lower()
+    # 同じタイトルを繰り返し変換するため結果をキャッシュする（0 は上限なし）
+    return _slugify_cached(value, max_length if max_length and max_length > 0 else 0)
+
+
+@lru_cache(maxsize=4096)
+def _slugify_cached(value: str, max_length: int) -> str:
+    if value.isascii():
+        # ASCII は NFKD で変化しないため正規化と encode/decode を省く
+        ascii_text = value.lower()
+    else:
+        normalized = unicodedata.normalize("NFKD", value)
+        ascii_text = normalized.encode("ascii", "ignore").decode("ascii").lower()
     slug = _SLUG_REGEX.sub("-", ascii_text).strip("-")
-    if max_length is not None and max_length > 0:
+    if max_length:
         slug = slug[:max_length]
     return slug or "note"
 
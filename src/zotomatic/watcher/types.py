@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping
@@ -22,9 +22,12 @@ class WatcherConfig:
     watch_dir: Path
     on_pdf_created: Callable[[Path], None]
     on_initial_scan_complete: Callable[[], None] | None = None
+    initial_batch_callback: Callable[[Iterable[Path]], None] | None = None
     state_repository: WatcherStateRepository | None = None
     verbose_logging: bool = False
     force_scan: bool = False
+    # 書き込み完了判定の差し替え口。None ならサイズの連続一致をポーリングで確認する
+    stability_prober: Callable[[Path], bool] | None = None
 
     def __post_init__(self) -> None:  # type: ignore[override]
         object.__setattr__(self, "watch_dir", Path(self.watch_dir).expanduser())
@@ -57,6 +60,7 @@ class WatcherConfig:
         state_repository: WatcherStateRepository | None = None,
         on_initial_scan_complete: Callable[[], None] | None = None,
         force_scan: bool = False,
+        initial_batch_callback: Callable[[Iterable[Path]], None] | None = None,
     ) -> WatcherConfig:
         watch_dir = settings.get("pdf_dir")
         if not watch_dir:
@@ -69,6 +73,7 @@ class WatcherConfig:
             on_pdf_created=callback,
             state_repository=state_repository,
             on_initial_scan_complete=on_initial_scan_complete,
+            initial_batch_callback=initial_batch_callback,
             verbose_logging=verbose,
             force_scan=force_scan,
         )
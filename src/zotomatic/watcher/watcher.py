@@ -10,6 +10,7 @@ from watchfiles import Change, watch
 from zotomatic.errors import ZotomaticWatcherError
 from zotomatic.logging import get_logger
 from zotomatic.repositories.types import DirectoryState, WatcherFileState
+from zotomatic.utils.fs import iter_file_paths
 from zotomatic.watcher.types import WatcherConfig
 
 
@@ -126,7 +127,10 @@ class PDFStorageWatcher:
             self._logger.debug("Watcher thread exiting.")
 
     def _initial_scan(self) -> None:
-        self._poll_for_new_files()
+        if self._config.initial_batch_callback:
+            self._collect_initial_batch()
+        else:
+            self._poll_for_new_files()
         self._force_scan = False
         if self._config.on_initial_scan_complete:
             try:
@@ -173,6 +177,38 @@ class PDFStorageWatcher:
             self._last_error = exc
             self._logger.exception("Polling watcher iteration failed.")
 
+    def _collect_initial_batch(self) -> None:
+        """
+        初回スキャンの検出結果をまとめて1回のバッチコールバックで通知する。
+        ファイル単位のコールバック発火を避けるため、イベント監視へ移行する前に実行する
+        """
+        batch: list[Path] = []
+        pending_states: list[WatcherFileState] = []
+        try:
+            self._ensure_watch_dir()
+            for pdf_path in self._scan_for_new_pdfs():
+                resolved = self._accept_candidate(pdf_path, pending_states)
+                if resolved is not None:
+                    batch.append(resolved)
+        except ZotomaticWatcherError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive guard
+            self._last_error = exc
+            self._logger.exception("Initial scan failed.")
+        finally:
+            self._flush_file_states(pending_states)
+
+        self._logger.info("Initial scan detected %s PDF(s).", len(batch))
+        if not batch:
+            return
+        callback = self._config.initial_batch_callback
+        assert callback is not None
+        try:
+            callback(batch)
+        except Exception as exc:  # pragma: no cover - callback定義側に依存
+            self._last_error = exc
+            self._logger.exception("Initial batch callback failed.")
+
     def _ensure_watch_dir(self) -> None:
         if self._config.watch_dir.exists():
             return
@@ -193,26 +229,17 @@ class PDFStorageWatcher:
             return []
         if not self._directory_state_repository:
             try:
-                return [
-                    p
-                    for p in sorted(self._config.watch_dir.rglob("*.pdf"))
-                    if p.is_file()
-                ]
+                return sorted(self._list_pdfs(self._config.watch_dir, recursive=True))
             except OSError as exc:  # pragma: no cover - depends on filesystem
                 self._logger.error("Failed to list PDFs: %s", exc, exc_info=True)
                 raise ZotomaticWatcherError("Failed to scan watch directory.") from exc
         if self._force_scan:
             try:
-                return [
-                    p
-                    for p in sorted(self._config.watch_dir.rglob("*.pdf"))
-                    if p.is_file()
-                ]
+                return sorted(self._list_pdfs(self._config.watch_dir, recursive=True))
             except OSError as exc:  # pragma: no cover - depends on filesystem
                 self._logger.error("Failed to list PDFs: %s", exc, exc_info=True)
                 raise ZotomaticWatcherError("Failed to scan watch directory.") from exc
 
-        pattern = f"*{self._config.pdf_suffix}"
         pdfs: list[Path] = []
         try:
             scan_targets: list[tuple[Path, bool]] = []
@@ -238,11 +265,7 @@ class PDFStorageWatcher:
                 except OSError:
                     continue
 
-                if recursive:
-                    iterator = dir_path.rglob(pattern)
-                else:
-                    iterator = dir_path.glob(pattern)
-                pdfs.extend(p for p in iterator if p.is_file())
+                pdfs.extend(self._list_pdfs(dir_path, recursive=recursive))
 
                 try:
                     state = DirectoryState.from_path(dir_path, current_mtime)
@@ -257,25 +280,46 @@ class PDFStorageWatcher:
 
         return sorted(set(pdfs))
 
+    def _list_pdfs(self, root: Path, recursive: bool) -> Iterable[Path]:
+        """scandir の DirEntry を使い、エントリごとの stat を避けて PDF を列挙する。"""
+
+        return iter_file_paths(root, f"*{self._config.pdf_suffix}", recursive)
+
     def _handle_candidate(self, path: Path) -> None:
+        resolved = self._accept_candidate(path)
+        if resolved is None:
+            return
+        self._logger.info("New PDF detected: %s", resolved)
+        self._dispatch_callback(resolved)
+
+    def _accept_candidate(
+        self,
+        path: Path,
+        state_buffer: list[WatcherFileState] | None = None,
+    ) -> Path | None:
+        """
+        候補PDFを検証し、通知対象であれば解決済みパスを返す。
+        書き込み中・処理済み・前回スキャンから未変更の場合はNoneを返す
+        state_bufferを渡した場合、ファイル状態は即時保存せずバッファへ積む
+        """
         try:
             resolved = path.resolve()
         except OSError:
             self._logger.debug("Could not resolve path %s; will retry later.", path)
             self._schedule_retry(path)
-            return
+            return None
 
         if resolved.suffix.lower() != self._config.pdf_suffix:
-            return
+            return None
         if not resolved.exists():
             self._logger.debug("Candidate %s no longer exists; skipping.", resolved)
-            return
+            return None
         if not self._wait_for_stable(resolved):
             self._logger.debug(
                 "PDF still being written: %s; retry scheduled.", resolved
             )
             self._schedule_retry(resolved)
-            return
+            return None
 
         stat = None
         if self._file_state_repository and not self._force_scan:
@@ -292,12 +336,12 @@ class PDFStorageWatcher:
                         mtime_ns=stat.st_mtime_ns,
                         size=stat.st_size,
                     )
-                    self._file_state_repository.upsert(state)
+                    self._store_file_state(state, state_buffer)
                     self._logger.debug(
                         "PDF unchanged since last scan; skipping: %s", resolved
                     )
                     self._skipped_by_state += 1
-                    return
+                    return None
             except Exception as exc:  # pragma: no cover - sqlite/filesystem dependent
                 self._logger.debug(
                     "Failed to consult watcher state for %s: %s", resolved, exc
@@ -306,7 +350,7 @@ class PDFStorageWatcher:
         with self._seen_lock:
             if resolved in self._seen:
                 self._logger.debug("PDF already processed: %s", resolved)
-                return
+                return None
             self._seen.add(resolved)
 
         if self._file_state_repository:
@@ -318,14 +362,32 @@ class PDFStorageWatcher:
                     mtime_ns=stat.st_mtime_ns,
                     size=stat.st_size,
                 )
-                self._file_state_repository.upsert(state)
+                self._store_file_state(state, state_buffer)
             except Exception as exc:  # pragma: no cover - sqlite/filesystem dependent
                 self._logger.debug(
                     "Failed to persist watcher state for %s: %s", resolved, exc
                 )
 
-        self._logger.info("New PDF detected: %s", resolved)
-        self._dispatch_callback(resolved)
+        return resolved
+
+    def _store_file_state(
+        self,
+        state: WatcherFileState,
+        state_buffer: list[WatcherFileState] | None,
+    ) -> None:
+        if state_buffer is not None:
+            state_buffer.append(state)
+            return
+        assert self._file_state_repository is not None
+        self._file_state_repository.upsert(state)
+
+    def _flush_file_states(self, states: list[WatcherFileState]) -> None:
+        if not states or not self._file_state_repository:
+            return
+        try:
+            self._file_state_repository.upsert_many(states)
+        except Exception as exc:  # pragma: no cover - sqlite dependent
+            self._logger.debug("Failed to persist watcher state batch: %s", exc)
 
     def _dispatch_callback(self, pdf_path: Path) -> None:
         try:
@@ -337,7 +399,14 @@ class PDFStorageWatcher:
     def _wait_for_stable(self, path: Path) -> bool:
         """
         保存直後のPDFは書き込みが終わっておらず破損の可能性があるためファイルサイズが複数回連続で変化しないことを確認
+        WatcherConfig.stability_prober が指定されていればそちらで判定する
         """
+        prober = self._config.stability_prober
+        if prober is not None:
+            return prober(path)
+        return self._poll_until_stable(path)
+
+    def _poll_until_stable(self, path: Path) -> bool:
         previous_size: int | None = None
         for _ in range(self._config.stability_checks):
             if not path.exists():
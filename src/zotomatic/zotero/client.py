@@ -1,5 +1,7 @@
 # Zoteroライブラリの情報検索とメタデータ読み込みなど、Zoteroとのやり取りを司るClient
 import os
+import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +15,8 @@ from zotomatic.zotero.types import ZoteroClientConfig, ZoteroPaper
 
 # TODO: 変数zot_clientをzotero_clientにリネームする
 
+_ATTACHMENT_SEARCH_LIMIT = 25
+
 
 class ZoteroClient:
     """Minimal Zotero API wrapper used while bringing up the pipeline."""
@@ -20,6 +24,9 @@ class ZoteroClient:
     def __init__(self, config: ZoteroClientConfig) -> None:
         self._config = config
         self._client: zotero_api.Zotero | None = self._create_client(config)
+        # 添付一覧の短期キャッシュ（取得時刻, 添付インデックス）
+        self._attachments_cache: tuple[float, _AttachmentIndex] | None = None
+        self._attachments_ttl = 30.0
 
     # TODO: configの生成はインスタンス生成側で行うため下記は削除
     # @classmethod
@@ -56,6 +63,39 @@ class ZoteroClient:
         attachment_key = attachment.get("key") if attachment else None
         return paper, attachment_key, parent_key
 
+    def invalidate_attachments_cache(self) -> None:
+        """添付一覧のキャッシュを破棄し、次回の照合で再取得させる。"""
+        self._attachments_cache = None
+
+    def get_papers_by_pdfs(
+        self, pdf_paths: Sequence[Path]
+    ) -> dict[Path, ZoteroPaper | None]:
+        """複数PDFをまとめて照合する。添付一覧の取得は1回で済ませる。"""
+        return {
+            path: info[0]
+            for path, info in self.get_papers_with_attachment_info(pdf_paths).items()
+        }
+
+    def get_papers_with_attachment_info(
+        self, pdf_paths: Sequence[Path]
+    ) -> dict[Path, tuple[ZoteroPaper | None, str | None, str | None]]:
+        empty: tuple[ZoteroPaper | None, str | None, str | None] = (None, None, None)
+        if self._client is None or not pdf_paths:
+            return {path: empty for path in pdf_paths}
+        index = self._get_attachments_cached()
+        if index is None:
+            return {path: empty for path in pdf_paths}
+        results: dict[Path, tuple[ZoteroPaper | None, str | None, str | None]] = {}
+        for path in pdf_paths:
+            attachment, parent_key = index.match(str(path))
+            if not parent_key:
+                results[path] = empty
+                continue
+            paper = mapper.build_paper(self._client, parent_key, str(path))
+            attachment_key = attachment.get("key") if attachment else None
+            results[path] = (paper, attachment_key, parent_key)
+        return results
+
     def build_context(self, pdf_path: Path) -> NoteBuilderContext | None:
         """Build context for NoteBuilder."""
         paper = self.get_paper_by_pdf(pdf_path)
@@ -99,33 +139,123 @@ class ZoteroClient:
     ) -> tuple[dict | None, str | None]:
         if self._client is None:
             return None, None
-        base = os.path.basename(pdf_path)
-        pdf_path_n = os.path.normpath(pdf_path)
+        cached = self._fresh_attachments_cache()
+        if cached is None:
+            # まずファイル名で絞り込んだ検索を試し、見つからなければ全件取得へ
+            candidates = self._search_attachments(os.path.basename(pdf_path))
+            if candidates:
+                attachment, parent = _AttachmentIndex.build(candidates).match(pdf_path)
+                if parent:
+                    return attachment, parent
+        index = cached or self._get_attachments_cached()
+        if index is None:
+            return None, None
+        return index.match(pdf_path)
+
+    def _fresh_attachments_cache(self) -> "_AttachmentIndex | None":
+        cached = self._attachments_cache
+        if cached is not None and time.monotonic() - cached[0] < self._attachments_ttl:
+            return cached[1]
+        return None
 
+    def _get_attachments_cached(self) -> "_AttachmentIndex | None":
+        cached = self._fresh_attachments_cache()
+        if cached is not None:
+            return cached
+        now = time.monotonic()
+        attachments = self._fetch_attachments()
+        if attachments is None:
+            return None
+        index = _AttachmentIndex.build(attachments)
+        self._attachments_cache = (now, index)
+        return index
+
+    def _fetch_attachments(self) -> list[dict] | None:
         # 添付を走査
         try:
             client = self._client
             assert client is not None
-            attachments = client.everything(client.items(itemType="attachment"))
+            return client.everything(client.items(itemType="attachment"))
         except Exception:  # pragma: no cover - pyzotero runtime error
-            return None, None
+            return None
+
+    def _search_attachments(self, filename: str) -> list[dict]:
+        # ファイル名のクイック検索で候補だけを取得
+        if not filename:
+            return []
+        try:
+            client = self._client
+            assert client is not None
+            return list(
+                client.items(
+                    itemType="attachment",
+                    q=filename,
+                    qmode="everything",
+                    limit=_ATTACHMENT_SEARCH_LIMIT,
+                )
+            )
+        except Exception:  # pragma: no cover - pyzotero runtime error
+            return []
+
+
+class _AttachmentIndex:
+    """添付一覧をパス末尾・ファイル名で引けるようにした索引。
+
+    照合順序は一覧を2回走査していた頃と同じで、各キーには一覧上で最初に
+    現れた添付（親アイテムを持つもの）だけを保持する。
+    """
 
-        # 1) パス末尾一致
-        for att in attachments:
+    __slots__ = ("_linked_by_suffix", "_linked_by_basename", "_by_basename")
+
+    def __init__(self) -> None:
+        self._linked_by_suffix: dict[str, tuple[int, dict, str]] = {}
+        self._linked_by_basename: dict[str, tuple[int, dict, str]] = {}
+        self._by_basename: dict[str, tuple[dict, str]] = {}
+
+    @classmethod
+    def build(cls, attachments: list[dict]) -> "_AttachmentIndex":
+        index = cls()
+        for order, att in enumerate(attachments):
             d = att.get("data", {})
+            parent = d.get("parentItem")
+            if not parent:
+                continue
             if d.get("linkMode") == "linked_file":
                 ap = os.path.normpath(d.get("path") or "")
-                if pdf_path_n.endswith(ap) or os.path.basename(ap) == base:
-                    parent = d.get("parentItem")
-                    if parent:
-                        return att, parent
+                entry = (order, att, parent)
+                index._linked_by_suffix.setdefault(ap, entry)
+                index._linked_by_basename.setdefault(os.path.basename(ap), entry)
+            name = os.path.basename(d.get("path") or d.get("filename") or "")
+            index._by_basename.setdefault(name, (att, parent))
+        return index
 
-        # 2) ファイル名一致
-        for att in attachments:
-            d = att.get("data", {})
-            if os.path.basename(d.get("path") or d.get("filename") or "") == base:
-                parent = d.get("parentItem")
-                if parent:
-                    return att, parent
+    def match(self, pdf_path: str) -> tuple[dict | None, str | None]:
+        base = os.path.basename(pdf_path)
+        pdf_path_n = os.path.normpath(pdf_path)
+
+        # 1) パス末尾一致（区切り位置ごとの末尾とファイル名で引き、一覧上の先頭を採用）
+        hits = [self._linked_by_basename.get(base)]
+        hits.extend(
+            self._linked_by_suffix.get(suffix) for suffix in _path_suffixes(pdf_path_n)
+        )
+        found = [hit for hit in hits if hit is not None]
+        if found:
+            _, att, parent = min(found, key=lambda hit: hit[0])
+            return att, parent
 
+        # 2) ファイル名一致
+        hit = self._by_basename.get(base)
+        if hit is not None:
+            return hit
         return None, None
+
+
+def _path_suffixes(path: str) -> list[str]:
+    """区切り文字の前後で切ったパス末尾を列挙する。"""
+    suffixes = [path]
+    start = path.find(os.sep)
+    while start != -1:
+        suffixes.append(path[start:])
+        suffixes.append(path[start + 1 :])
+        start = path.find(os.sep, start + 1)
+    return suffixes
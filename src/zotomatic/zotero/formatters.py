@@ -3,6 +3,8 @@ from typing import Iterable, Optional
 
 from zotomatic.zotero.types import ZoteroAnnotation, ZoteroPaper
 
+_YEAR_RE = re.compile(r"\d{4}")
+
 
 def authors_str(creators) -> str:
     names = []
@@ -17,7 +19,7 @@ def authors_str(creators) -> str:
 def extract_year(date_str: str) -> Optional[str]:
     if not date_str:
         return None
-    m = re.search(r"\d{4}", date_str)
+    m = _YEAR_RE.search(date_str)
     return m.group(0) if m else None
 
 
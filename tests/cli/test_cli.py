@@ -1,10 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
 import pytest
 
 from zotomatic import cli
 from zotomatic.errors import ZotomaticError
 
+# config show 用の読み取り専用設定（誤って書き換えたら例外になるよう凍結する）
+_FAKE_SETTINGS: Final[Mapping[str, tuple[Any, str]]] = MappingProxyType(
+    {
+        "note_dir": ("/notes", "file"),
+        "llm": (
+            MappingProxyType(
+                {
+                    "provider": "openai",
+                    "providers": MappingProxyType(
+                        {
+                            "openai": MappingProxyType(
+                                {"api_key": "sk-openai", "model": "gpt-4o-custom"}
+                            ),
+                            "gemini": MappingProxyType(
+                                {
+                                    "api_key": "gem-key",
+                                    "model": "gemini-1",
+                                    "base_url": "https://g.example",
+                                }
+                            ),
+                        }
+                    ),
+                }
+            ),
+            "file",
+        ),
+    }
+)
+
 
 def test_cli_help(capsys: pytest.CaptureFixture[str]) -> None:
     cli.main([])
@@ -21,85 +54,66 @@ def test_cli_version(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.Mon
     assert captured.out.strip() == "0.2.0"
 
 
-def test_cli_dispatch_scan(monkeypatch: pytest.MonkeyPatch) -> None:
-    called = {}
-
-    def fake_run_scan(options):
-        called["options"] = options
-
-    monkeypatch.setattr(cli.pipelines, "run_scan", fake_run_scan)
-    cli.main(["scan", "--once"])
-    assert called["options"]["once"] is True
-
-
-def test_cli_dispatch_template_create(monkeypatch: pytest.MonkeyPatch) -> None:
-    called = {}
-
-    def fake_template_create(options):
-        called["options"] = options
-
-    monkeypatch.setattr(cli.pipelines, "run_template_create", fake_template_create)
-    cli.main(["template", "create", "--path", "/tmp/tpl.md"])
-    assert called["options"]["template_path"] == "/tmp/tpl.md"
-
-
-def test_cli_dispatch_config_show(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.parametrize(
+    ("argv", "attr", "check"),
+    [
+        (["scan", "--once"], "run_scan", lambda o: o["once"] is True),
+        (
+            ["template", "create", "--path", "/tmp/tpl.md"],
+            "run_template_create",
+            lambda o: o["template_path"] == "/tmp/tpl.md",
+        ),
+        (["config", "show"], "run_config_show", lambda o: o == {}),
+        (["config"], "run_config_show", lambda o: o == {}),
+        (["config", "default"], "run_config_default", lambda o: o == {}),
+        (
+            ["llm", "set", "--provider", "chatgpt", "--model", "m"],
+            "run_llm_set",
+            lambda o: o["llm_provider"] == "openai" and o["llm_model"] == "m",
+        ),
+    ],
+    ids=[
+        "scan",
+        "template_create",
+        "config_show",
+        "config_default_show",
+        "config_default",
+        "llm_set",
+    ],
+)
+def test_cli_dispatch(
+    monkeypatch: pytest.MonkeyPatch,
+    argv: list[str],
+    attr: str,
+    check: Callable[[dict[str, Any]], bool],
+) -> None:
     called = {}
 
-    def fake_run_config_show(options):
+    def fake(options):
         called["options"] = options
 
-    monkeypatch.setattr(cli.pipelines, "run_config_show", fake_run_config_show)
-    cli.main(["config", "show"])
-    assert called["options"] == {}
-
+    monkeypatch.setattr(cli.pipelines, attr, fake)
+    cli.main(argv)
+    assert check(called["options"])
 
-def test_cli_dispatch_config_default_show(monkeypatch: pytest.MonkeyPatch) -> None:
-    called = {}
-
-    def fake_run_config_show(options):
-        called["options"] = options
 
-    monkeypatch.setattr(cli.pipelines, "run_config_show", fake_run_config_show)
-    cli.main(["config"])
-    assert called["options"] == {}
-
-
-def test_cli_dispatch_config_default(monkeypatch: pytest.MonkeyPatch) -> None:
-    called = {}
-
-    def fake_run_config_default(options):
-        called["options"] = options
-
-    monkeypatch.setattr(cli.pipelines, "run_config_default", fake_run_config_default)
-    cli.main(["config", "default"])
-    assert called["options"] == {}
+def test_cli_parser_configures_only_matched_command() -> None:
+    parser = cli._build_parser("scan")
+    args = parser.parse_args(["init"])
+    assert args.command == "init"
+    assert not hasattr(args, "pdf_dir")
+    with pytest.raises(SystemExit):
+        cli._build_parser("init").parse_args(["init"])
 
 
 def test_cli_config_show_all_llm_providers(
-    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    capsys: pytest.CaptureFixture[str], patch_many
 ) -> None:
-    fake_settings = {
-        "note_dir": ("/notes", "file"),
-        "llm": (
-            {
-                "provider": "openai",
-                "providers": {
-                    "openai": {"api_key": "sk-openai", "model": "gpt-4o-custom"},
-                    "gemini": {
-                        "api_key": "gem-key",
-                        "model": "gemini-1",
-                        "base_url": "https://g.example",
-                    },
-                },
-            },
-            "file",
-        ),
-    }
-    monkeypatch.setattr(
-        cli.pipelines.config, "get_config_with_sources", lambda _opts=None: fake_settings
+    patch_many(
+        cli.pipelines.config,
+        get_config_with_sources=lambda _opts=None: _FAKE_SETTINGS,
+        user_config_keys=lambda: {"note_dir"},
     )
-    monkeypatch.setattr(cli.pipelines.config, "user_config_keys", lambda: {"note_dir"})
     cli.main(["config", "show"])
     output = capsys.readouterr().out
     assert "Effective configuration:" in output
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> SimpleNamespace:
+    """tmp_path 配下でよく使う子パスをまとめて1回だけ組み立てる。"""
+    return SimpleNamespace(
+        notes=tmp_path / "notes",
+        pdfs=tmp_path / "pdfs",
+        template=tmp_path / "note.md",
+        config=tmp_path / "config.toml",
+        db=tmp_path / "state.db",
+    )
@@ -45,7 +45,7 @@ def test_generate_summary_missing_pdf_returns_empty(tmp_path: Path) -> None:
 
 def test_generate_summary_quick(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     pdf_path = tmp_path / "paper.pdf"
-    pdf_path.write_text("pdf", encoding="utf-8")
+    pdf_path.write_bytes(b"pdf")
     monkeypatch.setattr(
         "zotomatic.llm.client.pdf.extract_abstract_candidate",
         lambda path, logger=None: "Abstract",
@@ -59,7 +59,7 @@ def test_generate_summary_quick(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
 
 def test_generate_tags(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     pdf_path = tmp_path / "paper.pdf"
-    pdf_path.write_text("pdf", encoding="utf-8")
+    pdf_path.write_bytes(b"pdf")
     monkeypatch.setattr(
         "zotomatic.llm.client.pdf.extract_abstract_candidate",
         lambda path, logger=None: "Abstract",
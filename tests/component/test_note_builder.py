@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
+from zotomatic.note import builder as builder_module
 from zotomatic.note.builder import NoteBuilder
 from zotomatic.note.types import NoteBuilderConfig, NoteBuilderContext
 from zotomatic.repositories import NoteRepository, NoteRepositoryConfig
 
 
-def test_note_builder_generate_note(tmp_path: Path) -> None:
-    template = tmp_path / "note.md"
-    template.write_text("---\n---\n{title}\n{generated_summary}\n", encoding="utf-8")
-    repo = NoteRepository(NoteRepositoryConfig(root_dir=tmp_path / "notes"))
+def test_note_builder_generate_note(paths: SimpleNamespace) -> None:
+    paths.template.write_text(
+        "---\n---\n{title}\n{generated_summary}\n", encoding="utf-8"
+    )
+    repo = NoteRepository(NoteRepositoryConfig(root_dir=paths.notes))
     builder = NoteBuilder(
         repository=repo,
-        config=NoteBuilderConfig(template_path=template, filename_pattern="{{ citekey }}"),
+        config=NoteBuilderConfig(
+            template_path=paths.template, filename_pattern="{{ citekey }}"
+        ),
     )
     context = NoteBuilderContext(
         title="Title",
@@ -36,7 +41,7 @@ def test_note_builder_generate_note(tmp_path: Path) -> None:
 
 def test_note_builder_output_path_pattern(tmp_path: Path) -> None:
     template = tmp_path / "note.md"
-    template.write_text("{title}", encoding="utf-8")
+    template.write_bytes(b"{title}")
     repo = NoteRepository(NoteRepositoryConfig(root_dir=tmp_path / "notes"))
     builder = NoteBuilder(
         repository=repo,
@@ -46,3 +51,28 @@ def test_note_builder_output_path_pattern(tmp_path: Path) -> None:
     note = builder.generate_note(context)
     assert note.path.suffix == ".md"
     assert "2020" in str(note.path)
+
+
+def test_note_builder_filename_pattern_is_compiled_once() -> None:
+    builder_module._compile_filename_pattern.cache_clear()
+    context = {"year": "2020", "citekey": "Key"}
+    pattern = "p-{{ year }}/{{citekey}}.md"
+    assert builder_module._render_filename_pattern(pattern, context) == "p-2020/Key.md"
+    assert builder_module._render_filename_pattern(pattern, {}) == "p-/.md"
+    info = builder_module._compile_filename_pattern.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_note_builder_reloads_template_after_edit(paths: SimpleNamespace) -> None:
+    paths.template.write_bytes(b"first {title}")
+    builder = NoteBuilder(
+        repository=NoteRepository(NoteRepositoryConfig(root_dir=paths.notes)),
+        config=NoteBuilderConfig(
+            template_path=paths.template, filename_pattern="{{ citekey }}"
+        ),
+    )
+    context = NoteBuilderContext(title="T")
+    assert builder.render(context) == "first T"
+
+    paths.template.write_bytes(b"second edition {title}")
+    assert builder.render(context) == "second edition T"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
@@ -9,6 +10,9 @@ from zotomatic import pipelines
 from zotomatic.errors import ZotomaticCLIError
 from zotomatic.repositories.types import WatcherStateRepositoryConfig
 
+# run_doctor の subprocess.run 差し替え用（呼び出しごとに生成しない）
+_DOCTOR_OK = SimpleNamespace(stdout="", returncode=0)
+
 
 def test_run_template_create(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
@@ -35,7 +39,7 @@ def test_run_template_set(
 ) -> None:
     config_path = tmp_path / "config.toml"
     template_path = tmp_path / "note.md"
-    template_path.write_text("x", encoding="utf-8")
+    template_path.write_bytes(b"x")
 
     monkeypatch.setattr(pipelines.config, "_DEFAULT_CONFIG", config_path)
 
@@ -47,18 +51,15 @@ def test_run_template_set(
     assert "template_path" in text
 
 
-def test_run_doctor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    pdf_dir = tmp_path / "pdfs"
-    note_dir = tmp_path / "notes"
-    template_path = tmp_path / "note.md"
-    pdf_dir.mkdir()
-    template_path.write_text("x", encoding="utf-8")
+def test_run_doctor(paths: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    paths.pdfs.mkdir()
+    paths.template.write_bytes(b"x")
 
     settings = {
-        "config_path": str(tmp_path / "config.toml"),
-        "pdf_dir": str(pdf_dir),
-        "note_dir": str(note_dir),
-        "template_path": str(template_path),
+        "config_path": str(paths.config),
+        "pdf_dir": str(paths.pdfs),
+        "note_dir": str(paths.notes),
+        "template_path": str(paths.template),
         "llm": {
             "provider": "openai",
             "providers": {"openai": {"api_key": ""}},
@@ -67,37 +68,34 @@ def test_run_doctor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         "zotero_library_id": "",
         "zotero_library_scope": "user",
     }
-    config_path = Path(settings["config_path"])
-    config_path.write_text("", encoding="utf-8")
-
-    class DummyResult:
-        stdout = ""
+    paths.config.write_bytes(b"")
 
     monkeypatch.setattr(pipelines.config, "get_config", lambda _opts: settings)
-    monkeypatch.setattr(pipelines.subprocess, "run", lambda *args, **kwargs: DummyResult())
+    monkeypatch.setattr(pipelines.subprocess, "run", lambda *args, **kwargs: _DOCTOR_OK)
 
     result = pipelines.run_doctor({})
     assert result == 0
 
 
-def test_run_init(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
-    config_path = tmp_path / "config.toml"
-    template_path = tmp_path / "note.md"
-    db_path = tmp_path / "state.db"
-    monkeypatch.setattr(pipelines.config, "_DEFAULT_CONFIG", config_path)
+def test_run_init(
+    paths: SimpleNamespace,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(pipelines.config, "_DEFAULT_CONFIG", paths.config)
 
     monkeypatch.setattr(
         pipelines.WatcherStateRepositoryConfig,
         "from_settings",
-        lambda _settings: WatcherStateRepositoryConfig(sqlite_path=db_path),
+        lambda _settings: WatcherStateRepositoryConfig(sqlite_path=paths.db),
     )
     monkeypatch.setattr(pipelines.WatcherStateRepository, "from_settings", lambda _settings: object())
 
     pipelines.run_init(
         {
-            "pdf_dir": str(tmp_path / "pdfs"),
-            "note_dir": str(tmp_path / "notes"),
-            "template_path": str(template_path),
+            "pdf_dir": str(paths.pdfs),
+            "note_dir": str(paths.notes),
+            "template_path": str(paths.template),
         }
     )
 
@@ -116,7 +114,7 @@ def test_run_init_with_llm_provider(
     templates_dir = tmp_path / "templates"
     templates_dir.mkdir()
     source_template = templates_dir / "note.md"
-    source_template.write_text("Template", encoding="utf-8")
+    source_template.write_bytes(b"Template")
     monkeypatch.setattr(pipelines.config, "_DEFAULT_CONFIG", config_path)
     monkeypatch.setattr(pipelines.config, "_TEMPLATES_DIR", templates_dir)
     monkeypatch.setattr(
@@ -151,7 +149,7 @@ def test_run_llm_set(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: py
     templates_dir = tmp_path / "templates"
     templates_dir.mkdir()
     source_template = templates_dir / "note.md"
-    source_template.write_text("Template", encoding="utf-8")
+    source_template.write_bytes(b"Template")
     monkeypatch.setattr(pipelines.config, "_DEFAULT_CONFIG", config_path)
     monkeypatch.setattr(pipelines.config, "_TEMPLATES_DIR", templates_dir)
 
@@ -177,9 +175,9 @@ def test_run_scan_path_mode(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     pdf_path = tmp_path / "paper.pdf"
-    pdf_path.write_text("dummy", encoding="utf-8")
+    pdf_path.write_bytes(b"dummy")
     template_path = tmp_path / "note.md"
-    template_path.write_text("{title}", encoding="utf-8")
+    template_path.write_bytes(b"{title}")
     note_dir = tmp_path / "notes"
 
     settings = {
@@ -226,6 +224,62 @@ def test_run_scan_path_mode(
     assert "Note created:" in captured.out
 
 
+def test_run_scan_does_not_cache_fallback_context(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"dummy")
+    template_path = tmp_path / "note.md"
+    template_path.write_bytes(b"{title}")
+    settings = {
+        "note_dir": str(tmp_path / "notes"),
+        "template_path": str(template_path),
+        "note_title_pattern": "note-{{ title }}",
+        "llm_openai_api_key": "",
+        "zotero_api_key": "",
+        "zotero_library_id": "",
+        "zotero_library_scope": "user",
+    }
+
+    class DummyUsageStore:
+        def get(self, _usage_date: str):
+            return None
+
+        def upsert(self, _entry) -> None:
+            return None
+
+    class DummyUsageRepo:
+        usage = DummyUsageStore()
+
+    monkeypatch.setattr(pipelines.config, "get_config", lambda _opts: settings)
+    monkeypatch.setattr(
+        pipelines.LLMUsageRepository,
+        "from_settings",
+        lambda _settings: DummyUsageRepo(),
+    )
+
+    lookups: list[Path] = []
+    original_build_context = pipelines.ZoteroClient.build_context
+
+    def counting_build_context(self, path: Path):
+        lookups.append(path)
+        return original_build_context(self, path)
+
+    monkeypatch.setattr(pipelines.ZoteroClient, "build_context", counting_build_context)
+    original_create = pipelines.NoteWorkflow.create_new_note
+    failures = iter([True])
+
+    def flaky_create(self, context):
+        if next(failures, False):
+            raise RuntimeError("boom")
+        return original_create(self, context)
+
+    monkeypatch.setattr(pipelines.NoteWorkflow, "create_new_note", flaky_create)
+
+    assert pipelines.run_scan({"path": [str(pdf_path), str(pdf_path)]}) == 0
+    assert lookups == [pdf_path, pdf_path]
+
+
 def test_run_scan_watch_message(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -240,7 +294,7 @@ def test_run_scan_watch_message(
         "pdf_dir": str(tmp_path / "pdfs"),
     }
     Path(settings["note_dir"]).mkdir(parents=True, exist_ok=True)
-    Path(settings["template_path"]).write_text("{title}", encoding="utf-8")
+    Path(settings["template_path"]).write_bytes(b"{title}")
     Path(settings["pdf_dir"]).mkdir(parents=True, exist_ok=True)
 
     class DummyUsageStore:
@@ -273,11 +327,15 @@ def test_run_scan_watch_message(
         zotero_attachment = object()
         file_state = None
         directory_state = None
+        note_index = None
 
     class DummyPendingQueue:
         def enqueue(self, _path):
             return None
 
+        def enqueue_many(self, _paths):
+            return None
+
         def get_due(self, limit=1):
             return []
 
@@ -355,7 +413,7 @@ def test_run_scan_path_invalid(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     template_path = tmp_path / "note.md"
-    template_path.write_text("{title}", encoding="utf-8")
+    template_path.write_bytes(b"{title}")
     note_dir = tmp_path / "notes"
 
     settings = {
@@ -472,7 +530,7 @@ def test_run_config_default(
     templates_dir = tmp_path / "templates"
     templates_dir.mkdir()
     source_template = templates_dir / "note.md"
-    source_template.write_text("Template", encoding="utf-8")
+    source_template.write_bytes(b"Template")
 
     cfg_path = tmp_path / "config.toml"
     cfg_path.write_text("note_dir = \"/custom\"\n", encoding="utf-8")
@@ -480,8 +538,12 @@ def test_run_config_default(
 
     monkeypatch.setattr(pipelines.config, "_TEMPLATES_DIR", templates_dir)
     monkeypatch.setattr(pipelines.config, "_DEFAULT_CONFIG", cfg_path)
-    monkeypatch.setitem(
-        pipelines.config._DEFAULT_SETTINGS, "template_path", str(template_target)
+    monkeypatch.setattr(
+        pipelines.config,
+        "_DEFAULT_SETTINGS",
+        MappingProxyType(
+            {**pipelines.config._DEFAULT_SETTINGS, "template_path": str(template_target)}
+        ),
     )
 
     result = pipelines.run_config_default({})
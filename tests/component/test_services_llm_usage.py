@@ -43,3 +43,13 @@ def test_llm_usage_service_invalid_kind() -> None:
     service = LLMUsageService(repository=repo, daily_limit=None, logger=None)
     with pytest.raises(ZotomaticLLMUsageError):
         service.record_success("other")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(3, 3), (2.9, 2), (" 4 ", 4), ("x", None), (True, None), (None, None)],
+)
+def test_llm_usage_service_coerces_limit(raw: object, expected: int | None) -> None:
+    repo = MemoryUsageRepository(usage=MemoryUsageStore(data={}))
+    service = LLMUsageService(repository=repo, daily_limit=raw, logger=None)
+    assert service.daily_limit == expected
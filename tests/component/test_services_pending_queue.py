@@ -14,6 +14,10 @@ class MemoryPendingStore:
     def upsert(self, entry: PendingEntry) -> None:
         self.data[str(entry.file_path)] = entry
 
+    def upsert_many(self, entries) -> None:
+        for entry in entries:
+            self.upsert(entry)
+
     def get(self, file_path: str | Path):
         return self.data.get(str(Path(file_path)))
 
@@ -34,6 +38,8 @@ def test_pending_queue_enqueue_and_resolve(tmp_path: Path) -> None:
 
     due = queue.get_due(limit=10)
     assert len(due) == 1
+    assert due[0].pdf_path == pdf_path
+    assert due[0].pdf_path is due[0].file_path
 
     queue.resolve(pdf_path)
     assert store.get(pdf_path) is None
@@ -52,3 +58,12 @@ def test_pending_queue_update_attempt(tmp_path: Path) -> None:
     assert updated.last_error == "err"
     assert updated.last_attempt_at is not None
     assert entry is not None
+
+
+def test_pending_queue_enqueue_many(tmp_path: Path) -> None:
+    store = MemoryPendingStore(data={})
+    queue = PendingQueue(store)
+    paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    queue.enqueue_many(paths)
+    assert all(store.get(path) is not None for path in paths)
+    assert len(queue.get_due(limit=10)) == 2
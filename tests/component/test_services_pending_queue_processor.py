@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
+import random
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import pytest
@@ -38,10 +40,19 @@ class FakeQueue:
 class FakeResolver:
     is_enabled: bool
     result: object | None
+    batches: list[list[Path]] = field(default_factory=list)
+    invalidations: int = 0
 
     def resolve(self, _pdf_path):
         return self.result
 
+    def resolve_many(self, pdf_paths):
+        self.batches.append(list(pdf_paths))
+        return {Path(path): self.result for path in pdf_paths}
+
+    def invalidate_cache(self) -> None:
+        self.invalidations += 1
+
 
 def _entry(path: Path, attempt_count: int = 0) -> PendingEntry:
     return PendingEntry(
@@ -58,7 +69,7 @@ def test_processor_runs_without_resolver_when_disabled(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     pdf_path = tmp_path / "a.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
     queue = FakeQueue(entries=[_entry(pdf_path)], resolved=[], updates=[])
     resolver = FakeResolver(is_enabled=False, result=None)
     seen: list[Path] = []
@@ -74,7 +85,7 @@ def test_processor_runs_without_resolver_when_disabled(
 
 def test_processor_backoff_when_unresolved(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     pdf_path = tmp_path / "a.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
     queue = FakeQueue(entries=[_entry(pdf_path, attempt_count=1)], resolved=[], updates=[])
     resolver = FakeResolver(is_enabled=True, result=None)
     processor = PendingQueueProcessor(queue, resolver, lambda _p: None)
@@ -90,9 +101,30 @@ def test_processor_backoff_when_unresolved(tmp_path: Path, monkeypatch: pytest.M
     assert queue.updates[0]["attempt_count"] == 2
 
 
+def test_processor_backoff_uses_full_jitter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pdf_path = tmp_path / "a.pdf"
+    pdf_path.write_bytes(b"x")
+    queue = FakeQueue(entries=[_entry(pdf_path, attempt_count=2)], resolved=[], updates=[])
+    resolver = FakeResolver(is_enabled=True, result=None)
+    processor = PendingQueueProcessor(
+        queue, resolver, lambda _p: None, rng=random.Random(0)
+    )
+
+    monkeypatch.setattr("zotomatic.services.pending_queue_processor.time.time", lambda: 100)
+    monkeypatch.setattr(
+        PendingQueueProcessor, "_is_pdf_readable", lambda self, path: True
+    )
+
+    processor.run_once()
+    expected = 100 + random.Random(0).randint(0, 20)
+    assert queue.updates[0]["next_attempt_at"] == expected
+
+
 def test_processor_resolves_and_calls_callback(tmp_path: Path) -> None:
     pdf_path = tmp_path / "a.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
     queue = FakeQueue(entries=[_entry(pdf_path)], resolved=[], updates=[])
     resolver = FakeResolver(is_enabled=True, result={"paper": True})
     seen: list[Path] = []
@@ -107,7 +139,7 @@ def test_processor_resolves_and_calls_callback(tmp_path: Path) -> None:
 
 def test_processor_drops_unreadable_pdf(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     pdf_path = tmp_path / "a.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
 
     def fake_open(_path):
         raise RuntimeError("bad pdf")
@@ -127,7 +159,7 @@ def test_processor_drops_unreadable_pdf(tmp_path: Path, monkeypatch: pytest.Monk
 
 def test_processor_stops_on_event(tmp_path: Path) -> None:
     pdf_path = tmp_path / "a.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
     queue = FakeQueue(entries=[_entry(pdf_path)], resolved=[], updates=[])
     resolver = FakeResolver(is_enabled=True, result={"paper": True})
     stop_event = threading.Event()
@@ -135,3 +167,67 @@ def test_processor_stops_on_event(tmp_path: Path) -> None:
     processor = PendingQueueProcessor(queue, resolver, lambda _p: None, stop_event=stop_event)
     processed = processor.run_once()
     assert processed == 0
+
+
+def test_processor_resolves_batch_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = [tmp_path / f"paper{i}.pdf" for i in range(3)]
+    for path in paths:
+        path.write_bytes(b"x")
+    queue = FakeQueue(entries=[_entry(path) for path in paths], resolved=[], updates=[])
+    resolver = FakeResolver(is_enabled=True, result=object())
+    processor = PendingQueueProcessor(queue, resolver, lambda _p: None)
+    monkeypatch.setattr(
+        PendingQueueProcessor, "_is_pdf_readable", lambda self, path: True
+    )
+    assert processor.run_once() == 3
+    assert resolver.batches == [paths]
+    assert queue.resolved == paths
+    assert resolver.invalidations == 1
+
+
+def test_processor_logs_resolved_entries_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = [tmp_path / f"paper{i}.pdf" for i in range(2)]
+    for path in paths:
+        path.write_bytes(b"x")
+    queue = FakeQueue(entries=[_entry(path) for path in paths], resolved=[], updates=[])
+    resolver = FakeResolver(is_enabled=True, result=object())
+    processor = PendingQueueProcessor(queue, resolver, lambda _p: None)
+    monkeypatch.setattr(
+        PendingQueueProcessor, "_is_pdf_readable", lambda self, path: True
+    )
+    messages: list[str] = []
+    monkeypatch.setattr(
+        processor._logger, "info", lambda msg, *args: messages.append(msg % args)
+    )
+    assert processor.run_once() == 2
+    resolved = [msg for msg in messages if msg.startswith("Pending entries resolved")]
+    assert resolved == [f"Pending entries resolved (2): {paths[0]}, {paths[1]}"]
+
+
+def test_existing_paths_scans_each_parent_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    present = tmp_path / "present.pdf"
+    present.write_bytes(b"x")
+    missing = tmp_path / "missing.pdf"
+    orphan = tmp_path / "gone" / "orphan.pdf"
+    scanned: list[Path] = []
+    real_scandir = os.scandir
+
+    def _scandir(path):
+        scanned.append(Path(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(
+        "zotomatic.services.pending_queue_processor.os.scandir", _scandir
+    )
+    existing = PendingQueueProcessor._existing_paths(
+        [_entry(present), _entry(missing), _entry(orphan)]
+    )
+    assert existing == {present}
+    assert scanned == [tmp_path, tmp_path / "gone"]
+
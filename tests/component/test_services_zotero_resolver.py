@@ -24,13 +24,19 @@ class FakeClient:
     def get_paper_with_attachment_info(self, _pdf_path):
         return self._paper, self._attachment_key, self._parent_key
 
+    def get_papers_with_attachment_info(self, pdf_paths):
+        return {
+            path: (self._paper, self._attachment_key, self._parent_key)
+            for path in pdf_paths
+        }
+
     def is_enabled(self) -> bool:
         return True
 
 
 def test_resolver_persists_attachment(tmp_path: Path) -> None:
     pdf_path = tmp_path / "paper.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
     paper = ZoteroPaper(
         key="K",
         citekey=None,
@@ -71,3 +77,30 @@ def test_resolver_is_enabled() -> None:
     )
     resolver = ZoteroResolver(client=FakeClient(paper), attachment_store=MemoryAttachmentStore())
     assert resolver.is_enabled is True
+
+
+def test_resolver_resolve_many_persists_each(tmp_path: Path) -> None:
+    pdf_paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    for pdf_path in pdf_paths:
+        pdf_path.write_bytes(b"x")
+    paper = ZoteroPaper(
+        key="K",
+        citekey=None,
+        title="T",
+        year=None,
+        authors="",
+        publicationTitle=None,
+        DOI=None,
+        url=None,
+        abstractNote=None,
+        collections=[],
+        zoteroSelectURI="uri",
+        filePath=str(pdf_paths[0]),
+        annotations=[],
+    )
+    store = MemoryAttachmentStore()
+    resolver = ZoteroResolver(client=FakeClient(paper), attachment_store=store)
+    result = resolver.resolve_many(pdf_paths)
+    assert result == {pdf_paths[0]: paper, pdf_paths[1]: paper}
+    assert store.last_state is not None
+    assert store.last_state.file_path == pdf_paths[1]
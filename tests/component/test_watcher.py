@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import ntpath
 from pathlib import Path
 
 import pytest
 
+from zotomatic.utils import fs
 from zotomatic.watcher.types import WatcherConfig
 from zotomatic.watcher.watcher import PDFStorageWatcher
 from zotomatic.repositories.types import DirectoryState, WatcherFileState
@@ -33,15 +35,18 @@ def test_watcher_simulate_pdf_saved(tmp_path: Path) -> None:
     assert seen == [path]
 
 
-def test_handle_candidate_calls_callback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_handle_candidate_calls_callback(tmp_path: Path) -> None:
     seen: list[Path] = []
-    config = WatcherConfig(watch_dir=tmp_path, on_pdf_created=seen.append)
+    config = WatcherConfig(
+        watch_dir=tmp_path,
+        on_pdf_created=seen.append,
+        stability_prober=lambda _p: True,
+    )
     watcher = PDFStorageWatcher(config)
 
     pdf_path = tmp_path / "file.pdf"
-    pdf_path.write_text("data", encoding="utf-8")
+    pdf_path.write_bytes(b"data")
 
-    monkeypatch.setattr(watcher, "_wait_for_stable", lambda _p: True)
     watcher._handle_candidate(pdf_path)
     assert seen == [pdf_path.resolve()]
 
@@ -49,15 +54,37 @@ def test_handle_candidate_calls_callback(tmp_path: Path, monkeypatch: pytest.Mon
 def test_scan_for_new_pdfs_without_state(tmp_path: Path) -> None:
     config = WatcherConfig(watch_dir=tmp_path, on_pdf_created=lambda _p: None)
     watcher = PDFStorageWatcher(config)
-    (tmp_path / "a.pdf").write_text("x", encoding="utf-8")
-    (tmp_path / "b.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    (tmp_path / "b.txt").write_bytes(b"x")
     pdfs = watcher._scan_for_new_pdfs()
     assert len(pdfs) == 1
 
 
+def test_scan_for_new_pdfs_walks_subdirectories(tmp_path: Path) -> None:
+    config = WatcherConfig(watch_dir=tmp_path, on_pdf_created=lambda _p: None)
+    watcher = PDFStorageWatcher(config)
+    nested = tmp_path / "KEY1" / "sub"
+    nested.mkdir(parents=True)
+    (nested / "b.pdf").write_bytes(b"x")
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    (tmp_path / "dir.pdf").mkdir()
+    assert watcher._scan_for_new_pdfs() == [nested / "b.pdf", tmp_path / "a.pdf"]
+
+
+def test_scan_for_new_pdfs_matches_uppercase_suffix_on_windows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(fs, "_normcase", ntpath.normcase)
+    config = WatcherConfig(watch_dir=tmp_path, on_pdf_created=lambda _p: None)
+    watcher = PDFStorageWatcher(config)
+    (tmp_path / "X.PDF").write_bytes(b"x")
+    (tmp_path / "y.pdf").write_bytes(b"x")
+    assert watcher._scan_for_new_pdfs() == [tmp_path / "X.PDF", tmp_path / "y.pdf"]
+
+
 def test_force_scan_ignores_directory_state(tmp_path: Path) -> None:
     pdf_path = tmp_path / "a.pdf"
-    pdf_path.write_text("x", encoding="utf-8")
+    pdf_path.write_bytes(b"x")
     current_mtime = tmp_path.stat().st_mtime_ns
 
     class DummyDirectoryStateRepo:
@@ -82,12 +109,10 @@ def test_force_scan_ignores_directory_state(tmp_path: Path) -> None:
     assert pdfs == [pdf_path]
 
 
-def test_force_scan_ignores_file_state(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
+def test_force_scan_ignores_file_state(tmp_path: Path) -> None:
     seen: list[Path] = []
     pdf_path = tmp_path / "file.pdf"
-    pdf_path.write_text("data", encoding="utf-8")
+    pdf_path.write_bytes(b"data")
 
     state = WatcherFileState.from_path(
         file_path=pdf_path,
@@ -118,16 +143,16 @@ def test_force_scan_ignores_file_state(
         on_pdf_created=lambda p: seen.append(p),
         state_repository=DummyStateRepo(state),
         force_scan=True,
+        stability_prober=lambda _p: True,
     )
     watcher = PDFStorageWatcher(config)
-    monkeypatch.setattr(watcher, "_wait_for_stable", lambda _p: True)
     watcher._handle_candidate(pdf_path)
     assert seen == [pdf_path.resolve()]
 
 
-def test_skipped_by_state_increments(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_skipped_by_state_increments(tmp_path: Path) -> None:
     pdf_path = tmp_path / "file.pdf"
-    pdf_path.write_text("data", encoding="utf-8")
+    pdf_path.write_bytes(b"data")
     stat = pdf_path.stat()
     previous = WatcherFileState.from_path(
         file_path=pdf_path,
@@ -153,8 +178,47 @@ def test_skipped_by_state_increments(tmp_path: Path, monkeypatch: pytest.MonkeyP
         watch_dir=tmp_path,
         on_pdf_created=lambda _p: None,
         state_repository=DummyStateRepo(),
+        stability_prober=lambda _p: True,
     )
     watcher = PDFStorageWatcher(config)
-    monkeypatch.setattr(watcher, "_wait_for_stable", lambda _p: True)
     watcher._handle_candidate(pdf_path)
     assert watcher.skipped_by_state == 1
+
+
+def test_initial_scan_dispatches_single_batch(tmp_path: Path) -> None:
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    (tmp_path / "b.pdf").write_bytes(b"x")
+    seen: list[Path] = []
+    batches: list[list[Path]] = []
+    config = WatcherConfig(
+        watch_dir=tmp_path,
+        on_pdf_created=seen.append,
+        initial_batch_callback=lambda paths: batches.append(list(paths)),
+        stability_prober=lambda _p: True,
+    )
+    watcher = PDFStorageWatcher(config)
+    watcher._initial_scan()
+    assert seen == []
+    assert batches == [
+        [(tmp_path / "a.pdf").resolve(), (tmp_path / "b.pdf").resolve()]
+    ]
+
+
+def test_stability_prober_rejects_unstable_candidate(tmp_path: Path) -> None:
+    seen: list[Path] = []
+    probed: list[Path] = []
+
+    def prober(path: Path) -> bool:
+        probed.append(path)
+        return False
+
+    config = WatcherConfig(
+        watch_dir=tmp_path, on_pdf_created=seen.append, stability_prober=prober
+    )
+    watcher = PDFStorageWatcher(config)
+    pdf_path = tmp_path / "file.pdf"
+    pdf_path.write_bytes(b"data")
+
+    watcher._handle_candidate(pdf_path)
+    assert seen == []
+    assert probed == [pdf_path.resolve()]
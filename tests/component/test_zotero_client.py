@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -12,9 +13,23 @@ from zotomatic.zotero.types import ZoteroClientConfig, ZoteroPaper
 class FakeZoteroAPI:
     def __init__(self, attachments: list[dict]) -> None:
         self._attachments = attachments
+        self.items_calls = 0
+        self.searches: list[str] = []
 
-    def items(self, **_kwargs):
-        return self._attachments
+    def items(self, **kwargs):
+        self.items_calls += 1
+        query = kwargs.get("q")
+        if query is None:
+            return self._attachments
+        self.searches.append(query)
+        return [
+            att
+            for att in self._attachments
+            if query
+            in os.path.basename(
+                att["data"].get("path") or att["data"].get("filename") or ""
+            )
+        ]
 
     def everything(self, items):
         return items
@@ -85,6 +100,28 @@ def test_get_paper_with_attachment_info(monkeypatch: pytest.MonkeyPatch) -> None
     assert parent_key == "P2"
 
 
+def test_get_papers_by_pdfs_fetches_attachments_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attachments = [
+        {"data": {"filename": "a.pdf", "parentItem": "PA"}, "key": "AA"},
+        {"data": {"filename": "b.pdf", "parentItem": "PB"}, "key": "AB"},
+    ]
+    config = ZoteroClientConfig(library_id="id", api_key="key")
+    monkeypatch.setattr(zotero_client.zotero_api, "Zotero", lambda *_a, **_k: object())
+    client = zotero_client.ZoteroClient(config)
+    api = FakeZoteroAPI(attachments)
+    client._client = api
+    monkeypatch.setattr(
+        zotero_client.mapper, "build_paper", lambda _c, parent, _p: parent
+    )
+
+    paths = [Path("/tmp/a.pdf"), Path("/tmp/b.pdf"), Path("/tmp/missing.pdf")]
+    papers = client.get_papers_by_pdfs(paths)
+    assert papers == {paths[0]: "PA", paths[1]: "PB", paths[2]: None}
+    assert api.items_calls == 1
+
+
 def test_build_context_fallback() -> None:
     config = ZoteroClientConfig(library_id="", api_key="")
     client = zotero_client.ZoteroClient(config)
@@ -121,3 +158,105 @@ def test_build_context_enriched(monkeypatch: pytest.MonkeyPatch) -> None:
     assert context is not None
     assert context.citekey == "C"
     assert context.url == "https://example.com"
+
+
+def test_attachments_cache_respects_ttl_and_invalidation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attachments = [{"data": {"filename": "a.pdf", "parentItem": "PA"}, "key": "AA"}]
+    config = ZoteroClientConfig(library_id="id", api_key="key")
+    monkeypatch.setattr(zotero_client.zotero_api, "Zotero", lambda *_a, **_k: object())
+    client = zotero_client.ZoteroClient(config)
+    api = FakeZoteroAPI(attachments)
+    client._client = api
+    now = [100.0]
+    monkeypatch.setattr(zotero_client.time, "monotonic", lambda: now[0])
+
+    monkeypatch.setattr(
+        zotero_client.mapper, "build_paper", lambda _c, parent, _p: parent
+    )
+    paths = [Path("/tmp/a.pdf")]
+
+    client.get_papers_by_pdfs(paths)
+    client.get_papers_by_pdfs(paths)
+    # キャッシュが新しい間は単体照合も絞り込み検索をしない
+    client._find_attachment_by_pdf_path("/tmp/a.pdf")
+    assert api.items_calls == 1
+
+    now[0] += 31.0
+    client.get_papers_by_pdfs(paths)
+    assert api.items_calls == 2
+
+    client.invalidate_attachments_cache()
+    client.get_papers_by_pdfs(paths)
+    assert api.items_calls == 3
+
+
+def test_find_attachment_prefers_linked_suffix_in_list_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attachments = [
+        {"data": {"filename": "file.pdf", "parentItem": "P0"}, "key": "A0"},
+        {
+            "data": {"linkMode": "linked_file", "path": "dir/file.pdf"},
+            "key": "A1",
+        },
+        {
+            "data": {
+                "linkMode": "linked_file",
+                "path": "dir/file.pdf",
+                "parentItem": "P2",
+            },
+            "key": "A2",
+        },
+        {
+            "data": {
+                "linkMode": "linked_file",
+                "path": "/other/file.pdf",
+                "parentItem": "P3",
+            },
+            "key": "A3",
+        },
+    ]
+    config = ZoteroClientConfig(library_id="id", api_key="key")
+    monkeypatch.setattr(zotero_client.zotero_api, "Zotero", lambda *_a, **_k: object())
+    client = zotero_client.ZoteroClient(config)
+    client._client = FakeZoteroAPI(attachments)
+
+    attachment, parent = client._find_attachment_by_pdf_path("/tmp/dir/file.pdf")
+    assert parent == "P2"
+    assert attachment["key"] == "A2"
+
+    attachment, parent = client._find_attachment_by_pdf_path("/tmp/x/missing.pdf")
+    assert (attachment, parent) == (None, None)
+
+
+def test_find_attachment_uses_filename_search_then_falls_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attachments = [
+        {"data": {"filename": "a.pdf", "parentItem": "PA"}, "key": "AA"},
+        {
+            "data": {
+                "linkMode": "linked_file",
+                "path": "/lib/renamed.pdf",
+                "parentItem": "PB",
+            },
+            "key": "AB",
+        },
+    ]
+    config = ZoteroClientConfig(library_id="id", api_key="key")
+    monkeypatch.setattr(zotero_client.zotero_api, "Zotero", lambda *_a, **_k: object())
+    client = zotero_client.ZoteroClient(config)
+    api = FakeZoteroAPI(attachments)
+    client._client = api
+
+    assert client._find_attachment_by_pdf_path("/tmp/a.pdf")[1] == "PA"
+    assert (api.searches, api.items_calls) == (["a.pdf"], 1)
+
+    # 絞り込みで見つからなければ全件取得し、以降はキャッシュを使う
+    assert client._find_attachment_by_pdf_path("/tmp/x/missing.pdf") == (None, None)
+    assert (api.searches, api.items_calls) == (["a.pdf", "missing.pdf"], 3)
+
+    assert client._find_attachment_by_pdf_path("/lib/renamed.pdf")[1] == "PB"
+    assert api.items_calls == 3
@@ -37,3 +37,14 @@ def sqlite_schema_path(monkeypatch: pytest.MonkeyPatch) -> Path:
         sqlite_base.SQLiteRepository, "__post_init__", _patched_post_init, raising=True
     )
     return schema_path
+
+
+@pytest.fixture
+def patch_many(monkeypatch: pytest.MonkeyPatch):
+    """1つの対象へ複数の属性差し替えをまとめて行う。"""
+
+    def _patch(target: object, **attrs: object) -> None:
+        for name, value in attrs.items():
+            monkeypatch.setattr(target, name, value)
+
+    return _patch
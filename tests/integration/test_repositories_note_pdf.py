@@ -5,7 +5,13 @@ from pathlib import Path
 import pytest
 
 from zotomatic.repositories import NoteRepository, PDFRepository
-from zotomatic.repositories.types import NoteRepositoryConfig, PDFRepositoryConfig
+from zotomatic.repositories.types import (
+    NoteRepositoryConfig,
+    NoteIndexEntry,
+    PDFRepositoryConfig,
+    WatcherStateRepositoryConfig,
+)
+from zotomatic.repositories.watcher_state.sqlite.note_index import SqliteNoteIndexStore
 from zotomatic.errors import ZotomaticPDFRepositoryError
 
 
@@ -19,6 +25,20 @@ def test_note_repository_write_and_index(tmp_path: Path) -> None:
     assert repo.find_by_citekey("A") == path
 
 
+def test_note_repository_index_reads_frontmatter_only(tmp_path: Path) -> None:
+    repo = NoteRepository(NoteRepositoryConfig(root_dir=tmp_path / "notes"))
+    quoted = repo.write("quoted.md", '---\ntitle: T\ncitekey: "B"\n---\n' + "x" * 8192)
+    repo.write("body.md", "---\ntitle: T\n---\ncitekey: C\n")
+    plain = repo.write("plain.md", "# heading\ncitekey: D\n")
+
+    long_header = repo.write(
+        "long.md", "---\nabstract: " + "y" * 5000 + "\ncitekey: E\n---\n"
+    )
+
+    index = repo.build_citekey_index()
+    assert index == {"B": quoted, "D": plain, "E": long_header}
+
+
 def test_pdf_repository_read_and_list(tmp_path: Path) -> None:
     library = tmp_path / "library"
     library.mkdir()
@@ -31,7 +51,93 @@ def test_pdf_repository_read_and_list(tmp_path: Path) -> None:
     assert list(repo.list_pdfs()) == [pdf_path]
 
 
+def test_pdf_repository_resolve_cache_is_per_instance_and_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from zotomatic.repositories import pdf_repository
+
+    monkeypatch.setattr(pdf_repository, "_RESOLVE_CACHE_SIZE", 2)
+    first = PDFRepository(PDFRepositoryConfig(library_dir=tmp_path / "a"))
+    second = PDFRepository(PDFRepositoryConfig(library_dir=tmp_path / "b"))
+
+    assert first.resolve("x.pdf") == (tmp_path / "a" / "x.pdf").resolve()
+    assert second.resolve("x.pdf") == (tmp_path / "b" / "x.pdf").resolve()
+    for name in ("y.pdf", "z.pdf"):
+        first.resolve(name)
+    assert list(first._resolve_cache) == ["y.pdf", "z.pdf"]
+    assert list(second._resolve_cache) == ["x.pdf"]
+
+
+def test_pdf_repository_resolve_skips_cache_for_relative_library(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "one").mkdir()
+    (tmp_path / "two").mkdir()
+    repo = PDFRepository(PDFRepositoryConfig(library_dir=Path("lib")))
+
+    monkeypatch.chdir(tmp_path / "one")
+    assert repo.resolve("x.pdf") == tmp_path / "one" / "lib" / "x.pdf"
+    monkeypatch.chdir(tmp_path / "two")
+    assert repo.resolve("x.pdf") == tmp_path / "two" / "lib" / "x.pdf"
+    assert not repo._resolve_cache
+
+
 def test_pdf_repository_missing(tmp_path: Path) -> None:
     repo = PDFRepository(PDFRepositoryConfig(library_dir=tmp_path, recursive=False))
     with pytest.raises(ZotomaticPDFRepositoryError):
         repo.read_bytes("missing.pdf")
+
+
+def test_note_repository_write_recreates_removed_dir(tmp_path: Path) -> None:
+    repo = NoteRepository(NoteRepositoryConfig(root_dir=tmp_path / "notes"))
+    first = repo.write("sub/a.md", "a")
+    first.unlink()
+    first.parent.rmdir()
+    second = repo.write("sub/b.md", "b")
+    assert second.read_text(encoding="utf-8") == "b"
+
+
+def test_note_repository_index_store_skips_unchanged(
+    tmp_path: Path, sqlite_schema_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = SqliteNoteIndexStore(
+        WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    )
+    repo = NoteRepository(NoteRepositoryConfig(root_dir=tmp_path / "notes"))
+    a = repo.write("a.md", "---\ncitekey: A\n---\n")
+    b = repo.write("b.md", "---\ncitekey: B\n---\n")
+    assert repo.build_citekey_index(index_store=store) == {"A": a, "B": b}
+
+    reads: list[Path] = []
+    original = NoteRepository._read_citekey
+
+    def _tracking(self, note_path):
+        reads.append(note_path)
+        return original(self, note_path)
+
+    monkeypatch.setattr(NoteRepository, "_read_citekey", _tracking)
+    b.write_text("---\ncitekey: B2\n---\n", encoding="utf-8")
+    a.unlink()
+    index = repo.build_citekey_index(index_store=store)
+    assert index == {"B2": b}
+    assert reads == [b]
+    assert [entry.citekey for entry in store.list_under(tmp_path / "notes")] == ["B2"]
+
+
+def test_note_index_list_under_matches_prefix_exactly(
+    tmp_path: Path, sqlite_schema_path: Path
+) -> None:
+    store = SqliteNoteIndexStore(
+        WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    )
+    root = tmp_path / "notes_a"
+    store.upsert_many(
+        NoteIndexEntry(file_path=path, mtime_ns=1, size=1, citekey=citekey)
+        for path, citekey in [
+            (root / "a.md", "A"),
+            (tmp_path / "notesXa" / "b.md", "B"),
+            (tmp_path / "NOTES_A" / "c.md", "C"),
+            (tmp_path / "notes_ab" / "d.md", "D"),
+        ]
+    )
+    assert [entry.citekey for entry in store.list_under(root)] == ["A"]
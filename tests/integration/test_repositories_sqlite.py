@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import sqlite3
+import time
 from pathlib import Path
 
+import pytest
+
+from zotomatic.errors import ZotomaticWatcherStateRepositoryError
+from zotomatic.repositories import sqlite_base
 from zotomatic.repositories.types import (
     DirectoryState,
     LLMUsageEntry,
@@ -38,6 +44,26 @@ def test_sqlite_file_state_store(tmp_path: Path, sqlite_schema_path: Path) -> No
     assert store.count_under(file_path.parent) == 1
 
 
+def test_sqlite_file_state_store_upsert_many(
+    tmp_path: Path, sqlite_schema_path: Path
+) -> None:
+    config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    store = SqliteFileStateStore(config)
+    root = tmp_path / "pdfs"
+    states = [
+        WatcherFileState(file_path=root / f"{i}.pdf", mtime_ns=i, size=i, last_seen_at=1)
+        for i in range(3)
+    ]
+    store.upsert_many(states)
+    store.upsert_many([])
+    assert store.count_under(root) == 3
+    loaded = store.get(root / "2.pdf")
+    assert loaded is not None
+    assert loaded.size == 2
+    store.close()
+    assert store.get(root / "1.pdf") is not None
+
+
 def test_sqlite_directory_state_store(tmp_path: Path, sqlite_schema_path: Path) -> None:
     config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
     store = SqliteDirectoryStateStore(config)
@@ -71,6 +97,24 @@ def test_sqlite_pending_store(tmp_path: Path, sqlite_schema_path: Path) -> None:
     assert store.get("/tmp/file.pdf") is None
 
 
+def test_sqlite_pending_store_upsert_many(tmp_path: Path, sqlite_schema_path: Path) -> None:
+    config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    store = SqlitePendingStore(config)
+    store.upsert_many(
+        PendingEntry(
+            file_path=tmp_path / f"{i}.pdf",
+            first_seen_at=1,
+            last_attempt_at=None,
+            next_attempt_at=i,
+            attempt_count=0,
+            last_error=None,
+        )
+        for i in range(3)
+    )
+    assert store.count_all() == 3
+    assert [e.next_attempt_at for e in store.list_before(timestamp=1)] == [0, 1]
+
+
 def test_sqlite_zotero_attachment_store(tmp_path: Path, sqlite_schema_path: Path) -> None:
     config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
     store = SqliteZoteroAttachmentStore(config)
@@ -88,6 +132,21 @@ def test_sqlite_zotero_attachment_store(tmp_path: Path, sqlite_schema_path: Path
     assert loaded is not None
     assert loaded.parent_item_key == "P"
 
+    store.upsert(
+        ZoteroAttachmentState(
+            attachment_key="B",
+            parent_item_key=None,
+            file_path=None,
+            mtime_ns=None,
+            size=None,
+            sha1=None,
+            last_seen_at=3,
+        )
+    )
+    missing = store.get("B")
+    assert missing is not None
+    assert missing.file_path is None
+
 
 def test_sqlite_llm_usage_store(tmp_path: Path, sqlite_schema_path: Path) -> None:
     config = LLMUsageRepositoryConfig(sqlite_path=tmp_path / "usage.db")
@@ -97,3 +156,66 @@ def test_sqlite_llm_usage_store(tmp_path: Path, sqlite_schema_path: Path) -> Non
     loaded = store.get("2024-01-01")
     assert loaded is not None
     assert loaded.tag_count == 2
+
+
+def test_watcher_file_state_caches_path_str(tmp_path: Path) -> None:
+    state = WatcherFileState(
+        file_path=tmp_path / "a.pdf", mtime_ns=1, size=2, last_seen_at=3
+    )
+    assert state.path_str == str(tmp_path / "a.pdf")
+    assert state == WatcherFileState(
+        file_path=str(tmp_path / "a.pdf"), mtime_ns=1, size=2, last_seen_at=3
+    )
+
+
+def test_sqlite_schema_probe_runs_once_per_path(
+    tmp_path: Path, sqlite_schema_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    SqliteMetaStore(config)
+    calls: list[str] = []
+    monkeypatch.setattr(
+        sqlite_base.SQLiteRepository,
+        "_has_table",
+        lambda self, conn, name: calls.append(name) or True,
+    )
+    store = SqliteMetaStore(config)
+    store.set("key", "value")
+    assert calls == []
+
+
+def test_sqlite_txn_wraps_errors_and_rolls_back(
+    tmp_path: Path, sqlite_schema_path: Path
+) -> None:
+    config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    store = SqliteMetaStore(config)
+    with pytest.raises(ZotomaticWatcherStateRepositoryError):
+        with store._txn() as conn:
+            conn.execute("INSERT INTO meta (key, value) VALUES ('a', 'b')")
+            conn.execute("SELECT * FROM missing_table")
+    assert store.get("a") is None
+    store.set("key", "value")
+    assert store.get("key") == "value"
+
+
+def test_sqlite_reads_do_not_wait_for_other_writers(
+    tmp_path: Path, sqlite_schema_path: Path
+) -> None:
+    config = WatcherStateRepositoryConfig(sqlite_path=tmp_path / "state.db")
+    store = SqliteMetaStore(config)
+    store.set("key", "value")
+    writer = sqlite3.connect(config.sqlite_path, isolation_level=None, timeout=0)
+    try:
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("UPDATE meta SET value = 'other' WHERE key = 'key'")
+        started = time.perf_counter()
+        assert store.get("key") == "value"
+        assert time.perf_counter() - started < 1.0
+        with pytest.raises(ZotomaticWatcherStateRepositoryError):
+            with store._read() as conn:
+                conn.execute("SELECT * FROM missing_table")
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    store.set("key", "new")
+    assert store.get("key") == "new"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, Protocol
+
+import pytest
+
+from zotomatic.llm.types import LLMClientConfig
+
+
+@pytest.fixture(scope="session")
+def templates_src(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """読み取り専用のテンプレートディレクトリ。セッションで1回だけ作る。"""
+    templates_dir = tmp_path_factory.mktemp("templates")
+    (templates_dir / "note.md").write_bytes(b"Template")
+    return templates_dir
+
+
+class HttpResponse(Protocol):
+    def raise_for_status(self) -> None: ...
+
+    def json(self) -> Any: ...
+
+
+class FakeResponse:
+    def __init__(self, payload: Mapping[str, object]) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Mapping[str, object]:
+        return self._payload
+
+
+class FakeHttpClient:
+    """httpx.Client の代わりに post の呼び出しを記録する。"""
+
+    def __init__(self, response: HttpResponse) -> None:
+        self.response = response
+        self.last_url: str | None = None
+        self.last_json: dict[str, object] | None = None
+
+    def post(self, url: str, json: dict[str, object]) -> HttpResponse:
+        self.last_url = url
+        self.last_json = json
+        return self.response
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_http_client() -> Callable[..., FakeHttpClient]:
+    """payload か応答オブジェクトから FakeHttpClient を作るファクトリ。"""
+
+    def factory(
+        payload: Mapping[str, object] | None = None,
+        *,
+        response: HttpResponse | None = None,
+    ) -> FakeHttpClient:
+        return FakeHttpClient(response or FakeResponse(payload or {}))
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def gemini_config() -> LLMClientConfig:
+    return LLMClientConfig(
+        provider="gemini",
+        base_url="https://generativelanguage.googleapis.com/v1beta",
+        api_key="key",
+        model="gemini-2.0-flash",
+        timeout=5.0,
+        language_code="en",
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import stat
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -11,14 +13,26 @@ def test_update_config_value_creates_and_updates(tmp_path: Path) -> None:
     cfg = tmp_path / "config.toml"
     created = config.update_config_value(cfg, "note_dir", "/tmp/notes")
     assert created is True
-    assert "note_dir" in cfg.read_text(encoding="utf-8")
+    assert b"note_dir" in cfg.read_bytes()
 
     updated = config.update_config_value(cfg, "note_dir", "/tmp/notes")
     assert updated is False
 
     updated = config.update_config_value(cfg, "note_dir", "/tmp/notes2")
     assert updated is True
-    assert "/tmp/notes2" in cfg.read_text(encoding="utf-8")
+    assert b"/tmp/notes2" in cfg.read_bytes()
+
+
+def test_update_config_value_skips_write_when_unchanged(tmp_path: Path) -> None:
+    cfg = tmp_path / "config.toml"
+    cfg.write_text('note_dir="/tmp/notes"\nllm_tag_limit = 1\n', encoding="utf-8")
+    mtime = cfg.stat().st_mtime_ns
+
+    assert config.update_config_value(cfg, "note_dir", "/tmp/notes") is False
+    assert cfg.stat().st_mtime_ns == mtime
+    # bool と int は別の値として扱う
+    assert config.update_config_value(cfg, "llm_tag_limit", True) is True
+    assert b"llm_tag_limit = true" in cfg.read_bytes()
 
 
 def test_update_config_section_value_creates_and_updates(tmp_path: Path) -> None:
@@ -27,9 +41,9 @@ def test_update_config_section_value_creates_and_updates(tmp_path: Path) -> None
         cfg, "llm.providers.openai", "api_key", "key"
     )
     assert created is True
-    text = cfg.read_text(encoding="utf-8")
-    assert "[llm.providers.openai]" in text
-    assert "api_key = \"key\"" in text
+    data = cfg.read_bytes()
+    assert b"[llm.providers.openai]" in data
+    assert b'api_key = "key"' in data
 
     updated = config.update_config_section_value(
         cfg, "llm.providers.openai", "api_key", "key"
@@ -40,18 +54,56 @@ def test_update_config_section_value_creates_and_updates(tmp_path: Path) -> None
         cfg, "llm.providers.openai", "api_key", "key2"
     )
     assert updated is True
-    assert "api_key = \"key2\"" in cfg.read_text(encoding="utf-8")
+    assert b'api_key = "key2"' in cfg.read_bytes()
 
 
-def test_initialize_config_creates_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    templates_dir = tmp_path / "templates"
-    templates_dir.mkdir()
-    source_template = templates_dir / "note.md"
-    source_template.write_text("Template", encoding="utf-8")
-    monkeypatch.setattr(config, "_TEMPLATES_DIR", templates_dir)
+def test_apply_updates_writes_once(tmp_path: Path) -> None:
+    cfg = tmp_path / "config.toml"
+    cfg.write_text('[llm]\nprovider = "openai"\n', encoding="utf-8")
 
+    changed = config.apply_updates(
+        cfg,
+        {
+            "llm": {"provider": "gemini"},
+            "llm.providers.gemini": {"api_key": "key", "model": "m"},
+        },
+    )
+    assert changed == [
+        "llm.provider",
+        "llm.providers.gemini.api_key",
+        "llm.providers.gemini.model",
+    ]
+    data = cfg.read_bytes()
+    assert b'provider = "gemini"' in data
+    assert b"[llm.providers.gemini]" in data
+    assert list(tmp_path.iterdir()) == [cfg]
+
+    mtime = cfg.stat().st_mtime_ns
+    assert config.apply_updates(cfg, {"llm": {"provider": "gemini"}}) == []
+    assert cfg.stat().st_mtime_ns == mtime
+
+
+def test_apply_updates_keeps_symlink_and_mode(tmp_path: Path) -> None:
+    target = tmp_path / "dotfiles" / "config.toml"
+    target.parent.mkdir()
+    target.write_bytes(b'[llm]\nprovider = "openai"\n')
+    target.chmod(0o644)
+    link = tmp_path / "config.toml"
+    link.symlink_to(target)
+
+    assert config.apply_updates(link, {"llm": {"provider": "gemini"}}) == [
+        "llm.provider"
+    ]
+    assert link.is_symlink()
+    assert b'provider = "gemini"' in target.read_bytes()
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+
+def test_initialize_config_creates_files(
+    tmp_path: Path, patch_many, templates_src: Path
+) -> None:
     cfg_path = tmp_path / "config.toml"
-    monkeypatch.setattr(config, "_DEFAULT_CONFIG", cfg_path)
+    patch_many(config, _TEMPLATES_DIR=templates_src, _DEFAULT_CONFIG=cfg_path)
     template_target = tmp_path / "note.md"
     result = config.initialize_config(
         {
@@ -90,22 +142,35 @@ def test_default_paths_are_absolute() -> None:
     assert template_path.is_absolute()
 
 
-def test_reset_config_to_defaults_creates_backup(
+def test_default_settings_are_read_only(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    templates_dir = tmp_path / "templates"
-    templates_dir.mkdir()
-    source_template = templates_dir / "note.md"
-    source_template.write_text("Template", encoding="utf-8")
-    monkeypatch.setattr(config, "_TEMPLATES_DIR", templates_dir)
+    with pytest.raises(TypeError):
+        config._DEFAULT_SETTINGS["note_dir"] = "/x"  # type: ignore[index]
+
+    monkeypatch.setattr(config, "_DEFAULT_CONFIG", tmp_path / "missing.toml")
+    merged = config.get_config()
+    merged["llm_tag_limit"] = 0
+    assert config._DEFAULT_SETTINGS["llm_tag_limit"] == 8
+
 
+def test_reset_config_to_defaults_creates_backup(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_many,
+    templates_src: Path,
+) -> None:
     cfg_path = tmp_path / "config.toml"
     cfg_path.write_text("note_dir = \"/custom\"\n", encoding="utf-8")
     template_target = tmp_path / "note.md"
 
-    monkeypatch.setattr(config, "_DEFAULT_CONFIG", cfg_path)
-    monkeypatch.setitem(
-        config._DEFAULT_SETTINGS, "template_path", str(template_target)
+    patch_many(config, _TEMPLATES_DIR=templates_src, _DEFAULT_CONFIG=cfg_path)
+    monkeypatch.setattr(
+        config,
+        "_DEFAULT_SETTINGS",
+        MappingProxyType(
+            {**config._DEFAULT_SETTINGS, "template_path": str(template_target)}
+        ),
     )
 
     result = config.reset_config_to_defaults()
@@ -203,6 +268,20 @@ def test_build_llm_section_from_env() -> None:
     assert providers["gemini"]["model"] == "model"
 
 
+def test_build_llm_section_from_env_ignores_other_providers() -> None:
+    env = {
+        "llm_provider": " ChatGPT ",
+        "llm_openai_base_url": "https://example.com",
+        "llm_openai_model": "",
+        "llm_gemini_api_key": "other",
+    }
+    assert config._build_llm_section_from_env(env) == {
+        "provider": "openai",
+        "providers": {"openai": {"base_url": "https://example.com"}},
+    }
+    assert config._build_llm_section_from_env({"llm_provider": "unknown"}) == {}
+
+
 def test_migrate_config_moves_top_level_keys(tmp_path: Path) -> None:
     cfg_path = tmp_path / "config.toml"
     cfg_path.write_text(
@@ -227,3 +306,17 @@ def test_migrate_config_moves_top_level_keys(tmp_path: Path) -> None:
     assert "# schema_version is managed by zotomatic" in text
     assert "schema_version = 2" in text
     assert "llm_tag_limit = 8\n\n[llm.providers.openai]" in text
+
+
+def test_load_file_config_caches_until_written(tmp_path: Path) -> None:
+    cfg = tmp_path / "config.toml"
+    cfg.write_text('[llm]\nprovider = "openai"\n', encoding="utf-8")
+    config._read_toml_cached.cache_clear()
+
+    first = config._load_file_config(cfg)
+    first["llm"]["provider"] = "mutated"
+    assert config._load_file_config(cfg)["llm"]["provider"] == "openai"
+    assert config._read_toml_cached.cache_info().hits == 1
+
+    config.update_config_section_value(cfg, "llm", "provider", "gemini")
+    assert config._load_file_config(cfg)["llm"]["provider"] == "gemini"
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import ntpath
+import posixpath
+from pathlib import Path
+
+import pytest
+
+from zotomatic.utils import fs
+
+
+def test_iter_files_suffix_recursive(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.pdf").write_bytes(b"")
+    (tmp_path / "sub" / "b.pdf").write_bytes(b"")
+    (tmp_path / "c.txt").write_bytes(b"")
+    (tmp_path / "dir.pdf").mkdir()
+
+    found = sorted(fs.iter_file_paths(tmp_path, "*.pdf"))
+    assert found == [tmp_path / "a.pdf", tmp_path / "sub" / "b.pdf"]
+
+    flat = list(fs.iter_file_paths(tmp_path, "*.pdf", recursive=False))
+    assert flat == [tmp_path / "a.pdf"]
+
+
+def test_iter_files_wildcard_pattern(tmp_path: Path) -> None:
+    (tmp_path / "paper-1.pdf").write_bytes(b"")
+    (tmp_path / "other.pdf").write_bytes(b"")
+
+    assert list(fs.iter_files(tmp_path, "paper-?.pdf")) == [
+        str(tmp_path / "paper-1.pdf")
+    ]
+
+
+def test_compile_name_pattern_follows_platform_case_rules(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fs, "_normcase", posixpath.normcase)
+    assert not fs.compile_name_pattern("*.pdf")("A.PDF")
+    assert not fs.compile_name_pattern("paper-?.pdf")("Paper-1.PDF")
+
+    monkeypatch.setattr(fs, "_normcase", ntpath.normcase)
+    assert fs.compile_name_pattern("*.pdf")("A.PDF")
+    assert fs.compile_name_pattern("*.PDF")("a.pdf")
+    assert fs.compile_name_pattern("paper-?.pdf")("Paper-1.PDF")
+    assert not fs.compile_name_pattern("*.pdf")("a.md")
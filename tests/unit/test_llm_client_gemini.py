@@ -4,55 +4,21 @@ import httpx
 import pytest
 
 from zotomatic.errors import ZotomaticLLMAPIError
+from zotomatic.llm import client as client_module
 from zotomatic.llm.client import GeminiLLMClient
 from zotomatic.llm.types import LLMClientConfig
 
 
-class FakeResponse:
-    def __init__(self, payload: dict[str, object]) -> None:
-        self._payload = payload
-
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self) -> dict[str, object]:
-        return self._payload
-
-
-class FakeHttpClient:
-    def __init__(self, payload: dict[str, object]) -> None:
-        self.payload = payload
-        self.last_url: str | None = None
-        self.last_json: dict[str, object] | None = None
-
-    def post(self, url: str, json: dict[str, object]):
-        self.last_url = url
-        self.last_json = json
-        return FakeResponse(self.payload)
-
-    def close(self) -> None:
-        return None
-
-
-def _create_config() -> LLMClientConfig:
-    return LLMClientConfig(
-        provider="gemini",
-        base_url="https://generativelanguage.googleapis.com/v1beta",
-        api_key="key",
-        model="gemini-2.0-flash",
-        timeout=5.0,
-        language_code="en",
-    )
-
-
-def test_gemini_chat_completion_builds_payload() -> None:
+def test_gemini_chat_completion_builds_payload(
+    gemini_config: LLMClientConfig, fake_http_client
+) -> None:
     payload = {
         "candidates": [
             {"content": {"parts": [{"text": "Hello"}, {"text": " world"}]}}
         ]
     }
-    client = GeminiLLMClient(_create_config())
-    fake_http = FakeHttpClient(payload)
+    client = GeminiLLMClient(gemini_config)
+    fake_http = fake_http_client(payload)
     client._http_client = fake_http
 
     result, raw = client._chat_completion(
@@ -77,43 +43,46 @@ def test_gemini_chat_completion_builds_payload() -> None:
     ]
 
 
-def test_gemini_chat_completion_raises_api_error() -> None:
-    client = GeminiLLMClient(_create_config())
+_ERROR_PAYLOAD: dict[str, object] = {
+    "error": {
+        "message": "Invalid argument",
+        "status": "INVALID_ARGUMENT",
+        "code": 400,
+    }
+}
 
-    request = httpx.Request("POST", "https://example.com")
-    response = httpx.Response(
-        400,
-        request=request,
-        json={
-            "error": {
-                "message": "Invalid argument",
-                "status": "INVALID_ARGUMENT",
-                "code": 400,
-            }
-        },
-    )
 
-    class ErrorResponse:
-        def raise_for_status(self) -> None:
-            raise httpx.HTTPStatusError(
-                "bad request", request=request, response=response
-            )
+class ErrorResponse:
+    def __init__(self, error: httpx.HTTPStatusError) -> None:
+        self._error = error
 
-        def json(self) -> dict[str, object]:
-            return response.json()
+    def raise_for_status(self) -> None:
+        raise self._error
 
-        @property
-        def text(self) -> str:
-            return response.text
+    def json(self) -> dict[str, object]:
+        return _ERROR_PAYLOAD
 
-    class ErrorHttpClient:
-        def post(self, url: str, json: dict[str, object]):
-            return ErrorResponse()
+    @property
+    def text(self) -> str:
+        return self._error.response.text
 
-        def close(self) -> None:
-            return None
 
-    client._http_client = ErrorHttpClient()
+@pytest.fixture(scope="module")
+def http_status_error() -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://example.com")
+    response = httpx.Response(400, request=request, json=_ERROR_PAYLOAD)
+    return httpx.HTTPStatusError("bad request", request=request, response=response)
+
+
+def test_gemini_chat_completion_raises_api_error(
+    gemini_config: LLMClientConfig,
+    fake_http_client,
+    http_status_error: httpx.HTTPStatusError,
+) -> None:
+    client = GeminiLLMClient(gemini_config)
+    client._http_client = fake_http_client(
+        response=ErrorResponse(http_status_error)
+    )
 
     with pytest.raises(ZotomaticLLMAPIError) as excinfo:
         client._chat_completion(
@@ -123,3 +92,19 @@ def test_gemini_chat_completion_raises_api_error() -> None:
         )
     assert "INVALID_ARGUMENT" in str(excinfo.value)
     assert "Invalid argument" in str(excinfo.value)
+
+
+def test_gemini_clients_share_pooled_http_client(
+    gemini_config: LLMClientConfig,
+) -> None:
+    first = GeminiLLMClient(gemini_config)
+    second = GeminiLLMClient(gemini_config)
+    assert first._http_client is second._http_client
+
+    first.close()
+    assert not second._http_client.is_closed
+
+    client_module._close_http_clients()
+    assert second._http_client.is_closed
+    assert GeminiLLMClient(gemini_config)._http_client is not second._http_client
+    client_module._close_http_clients()
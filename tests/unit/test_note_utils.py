@@ -17,10 +17,30 @@ def test_parse_frontmatter_missing() -> None:
     assert note.parse_frontmatter("no frontmatter") == {}
 
 
+def test_parse_frontmatter_ignores_body_and_unclosed_block() -> None:
+    text = "---\r\ntitle: Example\r\n---\r\nbody: not meta\n---\n"
+    assert note.parse_frontmatter(text) == {"title": "Example"}
+    assert note.parse_frontmatter("---\ntitle: Example\n") == {}
+
+
+def test_parse_frontmatter_empty_block_stops_at_first_closing_line() -> None:
+    text = "---\n---\ncitekey: X\n---\n"
+    assert note.parse_frontmatter(text) == {}
+
+
+def test_ensure_frontmatter_keys_with_empty_block_and_body_rule() -> None:
+    text = "---\n---\n## Notes\ncitekey: draft\n\n---\nBody\n"
+    updated = note.ensure_frontmatter_keys(text, {"citekey": "Smith2020"})
+    assert updated == (
+        "---\ncitekey: Smith2020\n---\n## Notes\ncitekey: draft\n\n---\nBody\n"
+    )
+
+
 def test_parse_tags() -> None:
     assert note.parse_tags("[\"a\", 'b']") == ("a", "b")
     assert note.parse_tags("[]") == ()
     assert note.parse_tags("not list") == ()
+    assert note.parse_tags(" [ \"a\" , b, \"\" ] ") == ("a", "b")
 
 
 def test_extract_summary_block() -> None:
@@ -34,6 +54,16 @@ body
     assert note.extract_summary_block(text) == "line1\nline2"
 
 
+def test_extract_summary_block_edges() -> None:
+    assert note.extract_summary_block("> [!summary] Title\r\n> only\r\n") == "only"
+    assert note.extract_summary_block("> [!summary]\n> last") == "last"
+    assert note.extract_summary_block("[!summary]\nplain\n") == ""
+    assert note.extract_summary_block("no callout") == ""
+    # 最初の callout に引用行が無ければ、後続の callout は見ない
+    text = "> [!summary]\nplain\n> [!summary] Later\n> other\n"
+    assert note.extract_summary_block(text) == ""
+
+
 def test_update_frontmatter_value_updates_existing() -> None:
     text = """---
 key: old
@@ -80,7 +110,23 @@ Body
     assert updated == text
 
 
+def test_ensure_frontmatter_keys_inserts_missing_in_order() -> None:
+    text = "---\ntitle: T\ncitekey: X\n---\nBody\n"
+    updated = note.ensure_frontmatter_keys(
+        text, {"citekey": "Y", "pdf_local": "/p.pdf", "tags": "[]"}
+    )
+    assert updated == (
+        "---\ntitle: T\ncitekey: X\npdf_local: /p.pdf\ntags: []\n---\nBody\n"
+    )
+
+
 def test_normalize_path_value() -> None:
     decomposed = "マイドライブ"
     normalized = note.normalize_path_value(decomposed)
     assert normalized == "マイドライブ"
+
+
+def test_normalize_path_value_keeps_ascii_object() -> None:
+    value = "/tmp/papers/attention.pdf"
+    assert note.normalize_path_value(value) is value
+    assert note.normalize_path_value("") == ""
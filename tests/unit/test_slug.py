@@ -11,6 +11,10 @@ def test_slugify_non_ascii_fallback() -> None:
     assert slug.slugify("タイトル") == "note"
 
 
+def test_slugify_strips_diacritics() -> None:
+    assert slug.slugify("Café Résumé") == "cafe-resume"
+
+
 def test_slugify_max_length() -> None:
     assert slug.slugify("hello world", max_length=5) == "hello"
 
@@ -25,3 +29,12 @@ def test_sanitize_filename_invalid_chars() -> None:
 
 def test_sanitize_filename_reserved_windows_name() -> None:
     assert slug.sanitize_filename("CON") == "CON_"
+
+
+def test_slugify_caches_by_value_and_length() -> None:
+    slug._slugify_cached.cache_clear()
+    assert slug.slugify("Cached Title") == "cached-title"
+    assert slug.slugify("Cached Title", max_length=0) == "cached-title"
+    assert slug.slugify("Cached Title", max_length=6) == "cached"
+    info = slug._slugify_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 2)